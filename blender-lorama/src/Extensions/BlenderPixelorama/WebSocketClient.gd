@@ -4,6 +4,10 @@ extends Node
 @export var handshake_headers: PackedStringArray
 @export var supported_protocols: PackedStringArray
 var tls_options: TLSOptions = null
+# Raw texture frames and UV overlay keyframes exceed the 64 KiB defaults.
+# Outbound matches Blender's 128 MiB max_size, above a full 4096x4096 RGBA8 frame
+@export var outbound_buffer_size: int = 1 << 27
+@export var inbound_buffer_size: int = 1 << 24
 
 var socket := WebSocketPeer.new()
 var last_state := WebSocketPeer.STATE_CLOSED
@@ -33,6 +37,8 @@ func _setup_reconnect_timer():
 func connect_to_url(url: String) -> int:
 	socket.supported_protocols = supported_protocols
 	socket.handshake_headers = handshake_headers
+	socket.outbound_buffer_size = outbound_buffer_size
+	socket.inbound_buffer_size = inbound_buffer_size
 
 	var err := socket.connect_to_url(url, tls_options)
 	if err != OK:
@@ -69,6 +75,8 @@ func send(message) -> int:
 
 	if typeof(message) == TYPE_STRING:
 		return socket.send_text(message)
+	if typeof(message) == TYPE_PACKED_BYTE_ARRAY:
+		return socket.send(message)
 	return socket.send(var_to_bytes(message))
 
 
@@ -78,7 +86,8 @@ func get_message() -> Variant:
 	var pkt := socket.get_packet()
 	if socket.was_string_packet():
 		return pkt.get_string_from_utf8()
-	return bytes_to_var(pkt)
+	# Binary frames are raw Blender payloads, decoded by their receiver
+	return pkt
 
 
 func close(code: int = 1000, reason: String = "") -> void:
@@ -43,6 +43,8 @@ func _ready() -> void:
 
 func _on_server_connected():
 	status_label.text = "Blender: connected"
+	# Blender may have lost our edits while disconnected, start from full frames
+	texture_exporter.forget()
 	print("Successfully connected to Blender server")
 
 
@@ -75,7 +77,10 @@ func _on_project_changed():
 	
 
 
-func _on_recive_message(msg: String) -> void:
+func _on_recive_message(msg) -> void:
+	if msg is PackedByteArray:
+		_handle_binary_message(msg)
+		return
 	var message = JSON.parse_string(msg)
 	var type = message["type"]
 	print(message)
@@ -84,10 +89,22 @@ func _on_recive_message(msg: String) -> void:
 			_handle_uv_data(message)
 		"GET_IMAGES":
 			_handle_blender_images(message)
+		"SYNC_TEXTURE_RESYNC":
+			texture_exporter.forget(message["image_name"])
+			_export_texture_now()
 		_:
 			pass
 
 
+func _handle_binary_message(frame: PackedByteArray):
+	if UVOverlay.is_uv_frame(frame):
+		if not uv_overlay.apply_uv_frame(frame):
+			# A delta was lost, ask Blender for a full overlay
+			websocket_client.send(JSON.stringify({"type": "UV_OVERLAY_RESYNC"}))
+	else:
+		print("Unknown binary message from Blender")
+
+
 func _handle_uv_data(uv_data):
 	uv_overlay.clear_uv_overlay()
 	uv_overlay.set_uv_data(uv_data)
@@ -110,12 +127,12 @@ func _export_texture_now():
 	var current_project = extensions_api.project.current_project
 	var same_image = current_project.name == current_select_image 
 	if websocket_client.socket.get_ready_state() == WebSocketPeer.STATE_OPEN and same_image:
-		var message = texture_exporter.export(current_project.name)
-		if message:
-			var msg = JSON.stringify(message)
-			var result = websocket_client.send(msg)
+		var frame = texture_exporter.export_frame(current_project.name)
+		if not frame.is_empty():
+			var result = websocket_client.send(frame)
 			if result != OK:
-				print("Failed to send texture message, error code: ", result)
+				texture_exporter.forget(current_project.name)
+				print("Failed to send texture frame, error code: ", result)
 
 
 func on_connect_button_pressed() -> void:
@@ -1,9 +1,21 @@
 class_name TextureExporter
 extends Node
 
+# Binary texture frame, see blender-part/wire_format.py
+const TEXTURE_FRAME_MAGIC := "BLTX"
+const TEXTURE_FRAME_VERSION := 1
+const TEXTURE_FRAME_HEADER_SIZE := 20
+const TEXTURE_FRAME_DIRTY_RECTS := 0x01
+# Dirty regions are found on a grid of this many pixels
+const DIRTY_TILE_SIZE := 16
+# Above this share of changed pixels a full frame is cheaper
+const MAX_DIRTY_RATIO := 0.5
+
 var extensions_api
 var export_temp_dir: String
 var export_temp_dir_relative: String
+# Last image sent per Blender image name, used to find dirty rects
+var _last_exported := {}
 
 
 func _ready() -> void:
@@ -45,6 +57,110 @@ func export(image_name):
 	return null
 
 
+# Raw RGBA8 pixels of the current frame in a binary SYNC_TEXTURE frame,
+# written straight into the Blender image without touching the disk.
+# Only the rects that changed since the last export are sent; returns an
+# empty array when nothing changed.
+func export_frame(image_name) -> PackedByteArray:
+	if not extensions_api:
+		return PackedByteArray()
+
+	var project = extensions_api.project.current_project
+	var current_frame = project.frames[project.current_frame]
+	var blended_image = _create_blended_image(project, current_frame)
+	if blended_image.get_format() != Image.FORMAT_RGBA8:
+		blended_image.convert(Image.FORMAT_RGBA8)
+
+	var last: Image = _last_exported.get(image_name)
+	_last_exported[image_name] = blended_image
+	if last == null or last.get_size() != blended_image.get_size():
+		return _encode_texture_frame(image_name, blended_image)
+
+	var rects := _find_dirty_rects(last, blended_image)
+	if rects.is_empty():
+		return PackedByteArray()
+
+	var dirty_area := 0
+	for rect in rects:
+		dirty_area += rect.get_area()
+	if dirty_area > blended_image.get_width() * blended_image.get_height() * MAX_DIRTY_RATIO:
+		return _encode_texture_frame(image_name, blended_image)
+	return _encode_texture_frame(image_name, blended_image, rects)
+
+
+# Drop the cached export so the next frame is sent in full
+func forget(image_name = null) -> void:
+	if image_name == null:
+		_last_exported.clear()
+	else:
+		_last_exported.erase(image_name)
+
+
+# Changed regions as runs of dirty tiles within each tile row
+func _find_dirty_rects(old_image: Image, new_image: Image) -> Array[Rect2i]:
+	var rects: Array[Rect2i] = []
+	var width := new_image.get_width()
+	var height := new_image.get_height()
+	var row_size := width * 4
+	var old_data := old_image.get_data()
+	var new_data := new_image.get_data()
+
+	for tile_y in range(0, height, DIRTY_TILE_SIZE):
+		var tile_h := mini(DIRTY_TILE_SIZE, height - tile_y)
+		# Skip unchanged bands with one slice compare
+		var band_start := tile_y * row_size
+		var band_end := band_start + tile_h * row_size
+		if old_data.slice(band_start, band_end) == new_data.slice(band_start, band_end):
+			continue
+
+		var run_start := -1
+		for tile_x in range(0, width + DIRTY_TILE_SIZE, DIRTY_TILE_SIZE):
+			var dirty := false
+			if tile_x < width:
+				var tile := Rect2i(tile_x, tile_y, mini(DIRTY_TILE_SIZE, width - tile_x), tile_h)
+				dirty = old_image.get_region(tile).get_data() != new_image.get_region(tile).get_data()
+			if dirty and run_start < 0:
+				run_start = tile_x
+			elif not dirty and run_start >= 0:
+				rects.append(Rect2i(run_start, tile_y, mini(tile_x, width) - run_start, tile_h))
+				run_start = -1
+
+	return rects
+
+
+func _encode_texture_frame(image_name: String, image: Image, rects: Array[Rect2i] = []) -> PackedByteArray:
+	var name_bytes := image_name.to_utf8_buffer()
+	var frame := PackedByteArray()
+	frame.resize(TEXTURE_FRAME_HEADER_SIZE)
+	for i in range(4):
+		frame[i] = TEXTURE_FRAME_MAGIC.unicode_at(i)
+	frame.encode_u8(4, TEXTURE_FRAME_VERSION)
+	frame.encode_u8(5, TEXTURE_FRAME_DIRTY_RECTS if not rects.is_empty() else 0)
+	frame.encode_u16(6, name_bytes.size())
+	frame.encode_u32(8, image.get_width())
+	frame.encode_u32(12, image.get_height())
+	frame.encode_u32(16, image.get_width() * 4)
+	frame.append_array(name_bytes)
+	frame.resize(frame.size() + (4 - frame.size() % 4) % 4)
+	if rects.is_empty():
+		frame.append_array(image.get_data())
+		return frame
+
+	var header := PackedByteArray()
+	header.resize(4)
+	header.encode_u32(0, rects.size())
+	frame.append_array(header)
+	for rect in rects:
+		header.resize(16)
+		header.encode_u32(0, rect.position.x)
+		header.encode_u32(4, rect.position.y)
+		header.encode_u32(8, rect.size.x)
+		header.encode_u32(12, rect.size.y)
+		frame.append_array(header)
+		frame.append_array(image.get_region(rect).get_data())
+	return frame
+
+
 func _create_blended_image(project, frame) -> Image:
 	var blended_image = project.new_empty_image()
 
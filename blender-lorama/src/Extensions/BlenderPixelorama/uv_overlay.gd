@@ -1,8 +1,18 @@
 class_name UVOverlay
 extends Node2D
 
+# Binary UV overlay frame, see blender-part/wire_format.py
+const UV_FRAME_MAGIC := "BLUV"
+const UV_FRAME_HEADER_SIZE := 28
+const UV_FRAME_KEYFRAME := 0x01
+const UV_FRAME_QUANTIZED := 0x02
+
 var extensions_api
-var uv_data: Dictionary = {}
+# object name -> {polygon index: PackedVector2Array}, in UV space once
+# multiplied by point_scale (1 / grid for quantized frames)
+var faces_by_object: Dictionary = {}
+var point_scale := Vector2.ONE
+var last_sequence: int = -1
 var overlay_color := Color.RED * Color(1, 1, 1, 0.7)
 var line_width: float = 0.1
 var is_enabled: bool = true
@@ -16,38 +26,96 @@ func _ready() -> void:
 
 
 func _draw() -> void:
-	if uv_data.is_empty():
-		return
-	var faces_data = uv_data.get("data", [])
-	if faces_data.is_empty():
+	if faces_by_object.is_empty():
 		return
 	var project = extensions_api.project.current_project
-	var canvas_size = project.size
-	for face in faces_data:
-		if face is Array and face.size() >= 3:
-			_draw_uv_face(face, canvas_size)
-
-
-func _draw_uv_face(face: Array, canvas_size: Vector2i) -> void:
-	var points = PackedVector2Array()
-	for uv_coord in face:
-		if uv_coord is Array and uv_coord.size() >= 2:
-			var u = float(uv_coord[0])
-			var v = float(uv_coord[1])
-			u = clamp(u, 0.0, 1.0)
-			v = clamp(v, 0.0, 1.0)
-			var x = u * canvas_size.x
-			var y = v * canvas_size.y
-			points.append(Vector2(x, y))
-	if points.size() >= 3:
-		var poly_points = points.duplicate()
-		poly_points.append(points[0])
-		draw_polyline(poly_points, overlay_color, line_width)
+	var canvas_size := Vector2(project.size) * point_scale
+	var uv_to_canvas := Transform2D(Vector2(canvas_size.x, 0), Vector2(0, canvas_size.y), Vector2.ZERO)
+	for faces in faces_by_object.values():
+		for face in faces.values():
+			if face.size() >= 3:
+				_draw_uv_face(uv_to_canvas * face)
+
+
+func _draw_uv_face(points: PackedVector2Array) -> void:
+	points.append(points[0])
+	draw_polyline(points, overlay_color, line_width)
 
 
+# JSON payload: {"data": [[[u, v], ...], ...]}
 func set_uv_data(data: Dictionary) -> void:
-	uv_data = data
+	var faces := {}
+	for face in data.get("data", []):
+		if not face is Array:
+			continue
+		var points = PackedVector2Array()
+		for uv_coord in face:
+			if uv_coord is Array and uv_coord.size() >= 2:
+				points.append(Vector2(float(uv_coord[0]), float(uv_coord[1])))
+		faces[faces.size()] = points
+	faces_by_object = {"": faces}
+	point_scale = Vector2.ONE
+	queue_redraw()
+
+
+static func is_uv_frame(frame: PackedByteArray) -> bool:
+	return frame.size() >= UV_FRAME_HEADER_SIZE and frame.slice(0, 4).get_string_from_ascii() == UV_FRAME_MAGIC
+
+
+# Apply a keyframe or delta frame, see blender-part/wire_format.py.
+# Returns false when a delta does not follow the last applied frame; the
+# caller should then ask Blender for a keyframe.
+func apply_uv_frame(frame: PackedByteArray) -> bool:
+	if not is_uv_frame(frame):
+		return true
+	var flags := frame.decode_u8(5)
+	var object_count := frame.decode_u16(6)
+	var sequence := frame.decode_u32(8)
+	var face_count := frame.decode_u32(12)
+	var grid := Vector2(frame.decode_u32(20), frame.decode_u32(24))
+	var keyframe := (flags & UV_FRAME_KEYFRAME) != 0
+	if not keyframe and sequence != (last_sequence + 1) & 0xFFFFFFFF:
+		return false
+
+	var pos := UV_FRAME_HEADER_SIZE
+	var names := PackedStringArray()
+	for i in range(object_count):
+		var length := frame.decode_u16(pos)
+		names.append(frame.slice(pos + 2, pos + 2 + length).get_string_from_utf8())
+		pos += 2 + length
+	pos += (4 - pos % 4) % 4
+
+	var removed_count := frame.decode_u32(pos)
+	pos += 4
+	var removed_objects := frame.slice(pos, pos + removed_count * 4).to_int32_array()
+	pos += removed_count * 4
+	var removed_polygons := frame.slice(pos, pos + removed_count * 4).to_int32_array()
+	pos += removed_count * 4
+	var face_objects := frame.slice(pos, pos + face_count * 4).to_int32_array()
+	pos += face_count * 4
+	var face_polygons := frame.slice(pos, pos + face_count * 4).to_int32_array()
+	pos += face_count * 4
+	var offsets := frame.slice(pos, pos + (face_count + 1) * 4).to_int32_array()
+	pos += (face_count + 1) * 4
+	# Points are a Variant encoded PackedVector2Array, decoded in one call.
+	# Quantized points stay in grid steps; _draw() scales them to UV space
+	var points: PackedVector2Array = bytes_to_var(frame.slice(pos))
+
+	if keyframe:
+		faces_by_object.clear()
+		# The grid only changes with a keyframe
+		point_scale = Vector2.ONE / grid if (flags & UV_FRAME_QUANTIZED) != 0 else Vector2.ONE
+	for i in range(removed_count):
+		var faces: Dictionary = faces_by_object.get(names[removed_objects[i]], {})
+		faces.erase(removed_polygons[i])
+	for i in range(face_count):
+		var object_name := names[face_objects[i]]
+		if not faces_by_object.has(object_name):
+			faces_by_object[object_name] = {}
+		faces_by_object[object_name][face_polygons[i]] = points.slice(offsets[i], offsets[i + 1])
+	last_sequence = sequence
 	queue_redraw()
+	return true
 
 
 func set_overlay_color(color: Color) -> void:
@@ -67,5 +135,5 @@ func set_enabled(enabled: bool) -> void:
 
 
 func clear_uv_overlay() -> void:
-	uv_data.clear()
+	faces_by_object.clear()
 	queue_redraw()
@@ -30,8 +30,13 @@ except Exception as e:
 
 if dependencies_loaded:
     from .blender_integration import setup_blender_integration
-    from .image_manager import ImageManager
-    from .operators import SERVER_OT_start, SERVER_OT_stop, WORLD_OT_setup_grid
+    from .image_manager import ImageManager, pack_dirty_images_handler
+    from .operators import (
+        IMAGE_OT_pack_synced_images,
+        SERVER_OT_start,
+        SERVER_OT_stop,
+        WORLD_OT_setup_grid,
+    )
     from .server import stop_server
     from .texture_processor import (
         TEXTURE_OT_check_texture,
@@ -44,12 +49,13 @@ if dependencies_loaded:
         WS_PT_WorldGridPanel,
     )
     from .unwrap_tools import UV_OT_unwrap_pixel_perfect, UV_OT_unwrap_to_grid
-    from .watch import ImagesStateWatch, UvWatch
+    from .watch import ImagesStateWatch, UvWatch, uv_depsgraph_update_handler
 
     classes = (
         SERVER_OT_start,
         SERVER_OT_stop,
         WORLD_OT_setup_grid,
+        IMAGE_OT_pack_synced_images,
         WS_PT_ServerPanel,
         WS_PT_UVToolsPanel,
         WS_PT_TextureToolsPanel,
@@ -63,6 +69,12 @@ else:
     classes = ()
 
 
+def _resync_uv_overlay(self, context):
+    # The overlay grid changed, so clients need a new keyframe
+    if UvWatch.instance:
+        UvWatch.instance.request_sync()
+
+
 def register_scene_properties():
     bpy.types.Scene.pixel_checker_texture_size = bpy.props.IntProperty(
         name="Checker Texture Size",
@@ -76,11 +88,27 @@ def register_scene_properties():
         min=1,
         max=64,
     )
+    bpy.types.Scene.uv_overlay_quantize = bpy.props.BoolProperty(
+        name="Quantize Overlay",
+        description="Send overlay UVs as integers on a sub-texel grid of the synced image",
+        default=False,
+        update=_resync_uv_overlay,
+    )
+    bpy.types.Scene.uv_overlay_subtexel_steps = bpy.props.IntProperty(
+        name="Sub-texel Steps",
+        description="Overlay UV precision in steps per texel",
+        default=16,
+        min=1,
+        max=256,
+        update=_resync_uv_overlay,
+    )
 
 
 def unregister_scene_properties():
     del bpy.types.Scene.pixel_checker_texture_size
     del bpy.types.Scene.world_grid_subdivisions
+    del bpy.types.Scene.uv_overlay_quantize
+    del bpy.types.Scene.uv_overlay_subtexel_steps
 
 
 def register():
@@ -96,9 +124,15 @@ def register():
     UvWatch()
     ImagesStateWatch()
 
-    if not bpy.app.timers.is_registered(UvWatch.instance.check_for_changes):
+    if uv_depsgraph_update_handler not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(uv_depsgraph_update_handler)
+
+    if pack_dirty_images_handler not in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.append(pack_dirty_images_handler)
+
+    if not bpy.app.timers.is_registered(UvWatch.instance.check_timer):
         bpy.app.timers.register(
-            UvWatch.instance.check_for_changes, first_interval=0.5, persistent=True
+            UvWatch.instance.check_timer, first_interval=0.5, persistent=True
         )
 
     if not bpy.app.timers.is_registered(ImagesStateWatch.instance.check_for_changes):
@@ -128,8 +162,15 @@ def unregister():
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
-    if bpy.app.timers.is_registered(UvWatch.instance.check_for_changes):
-        bpy.app.timers.unregister(UvWatch.instance.check_for_changes)
+    if uv_depsgraph_update_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(uv_depsgraph_update_handler)
+    if pack_dirty_images_handler in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.remove(pack_dirty_images_handler)
+    if bpy.app.timers.is_registered(UvWatch.instance.flush_timer):
+        bpy.app.timers.unregister(UvWatch.instance.flush_timer)
+    if bpy.app.timers.is_registered(UvWatch.instance.check_timer):
+        bpy.app.timers.unregister(UvWatch.instance.check_timer)
+    UvWatch.instance.stop()
     if bpy.app.timers.is_registered(ImagesStateWatch.instance.check_for_changes):
         bpy.app.timers.unregister(ImagesStateWatch.instance.check_for_changes)
 
@@ -6,6 +6,8 @@ import bpy
 
 from . import server
 from .image_manager import ImageManager
+from .watch import UvWatch
+from .wire_format import TEXTURE_FRAME_MAGIC, unpack_texture_frame
 
 
 def get_images():
@@ -31,6 +33,8 @@ def on_client_connected(client_info, websocket):
     """Called when a client connects to the WebSocket server"""
     print(f"[Blender] Client connected: {client_info}")
     get_images()
+    if UvWatch.instance:
+        UvWatch.instance.request_sync(client_info)
 
 
 def on_client_disconnected(client_info):
@@ -51,6 +55,9 @@ def on_message_received(client_info, message_data):
             get_images()
         case "SYNC_TEXTURE":
             handle_sync_texture(message_data)
+        case "UV_OVERLAY_RESYNC":
+            if UvWatch.instance:
+                UvWatch.instance.request_sync(client_info)
         case _:
             print(f"[Blender] Unknown message type: {msg_type}")
 
@@ -77,6 +84,8 @@ def handle_sync_texture(message_data):
 
         # Load or create image in Blender using ImageManager
         if ImageManager.INSTANCE:
+            # The synced image is the overlay's target for quantization
+            ImageManager.INSTANCE.set_image_name(image_name)
             blender_image = ImageManager.INSTANCE.load_or_create_image(
                 image_name, file_path, project_size
             )
@@ -113,12 +122,64 @@ def handle_sync_texture(message_data):
         server.send_message(response)
 
 
+def on_binary_received(client_info, data):
+    """Called when a binary frame is received from a client"""
+    magic = bytes(data[:4])
+    if magic == TEXTURE_FRAME_MAGIC:
+        handle_sync_texture_frame(data)
+    else:
+        print(f"[Blender] Unknown binary frame {magic!r} from {client_info}")
+
+
+def handle_sync_texture_frame(data):
+    """Handle a binary SYNC_TEXTURE frame - raw RGBA8 pixels, no file on disk"""
+    image_name = None
+    try:
+        frame = unpack_texture_frame(data)
+        image_name = frame.image_name
+        kind = "full" if frame.full else f"{len(frame.patches)} rects"
+        print(
+            f"[Blender] Syncing texture '{image_name}' "
+            f"({frame.width}x{frame.height}, {kind}) from frame"
+        )
+
+        if ImageManager.INSTANCE:
+            ImageManager.INSTANCE.set_image_name(image_name)
+            ImageManager.INSTANCE.update_image_from_frame(frame)
+            server.send_message(
+                {
+                    "type": "SYNC_TEXTURE_RESPONSE",
+                    "success": True,
+                    "image_name": image_name,
+                    "size": [frame.width, frame.height],
+                }
+            )
+
+    except Exception as e:
+        print(f"[Blender] Error in handle_sync_texture_frame: {e}")
+        server.send_message(
+            {
+                "type": "SYNC_TEXTURE_RESPONSE",
+                "success": False,
+                "image_name": image_name or "unknown",
+                "error": str(e),
+            }
+        )
+
+
+def request_texture_resync(image_name):
+    """Ask the client for a full frame when a dirty-rect update can't be applied"""
+    server.send_message({"type": "SYNC_TEXTURE_RESYNC", "image_name": image_name})
+
+
 def setup_blender_integration():
     """Set up the integration between server and Blender"""
+    ImageManager.on_full_sync_needed = request_texture_resync
     # Register callback functions
     server.set_callbacks(
         on_connected=on_client_connected,
         on_disconnected=on_client_disconnected,
         on_message=on_message_received,
+        on_binary=on_binary_received,
     )
     print("[Blender] WebSocket-Blender integration set up")
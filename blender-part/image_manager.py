@@ -4,16 +4,24 @@ import threading
 from multiprocessing import Lock
 
 import bpy
+import numpy as np
+from bpy.app.handlers import persistent
 
 
 class ImageManager:
     INSTANCE = None
     UPDATING_IMAGE = Lock()
+    # Called with an image name when a dirty-rect update cannot be applied
+    on_full_sync_needed = None
 
     def __init__(self) -> None:
         if not ImageManager.INSTANCE:
             self.IMAGE_NAME = None
             self._update_queue = queue.Queue()
+            self._pixel_mirrors = {}
+            self._pixel_buffers = {}
+            # Synced images whose pixels changed since they were last packed
+            self._dirty_images = set()
             self._main_thread_id = threading.get_ident()
             ImageManager.INSTANCE = self
 
@@ -37,6 +45,28 @@ class ImageManager:
         else:
             return None
 
+    def has_dirty_images(self):
+        return bool(self._dirty_images)
+
+    def pack_dirty_images(self):
+        """Pack synced images changed since the last pack - main thread only"""
+        packed_count = 0
+        with ImageManager.UPDATING_IMAGE:
+            for image_name in sorted(self._dirty_images):
+                image = bpy.data.images.get(image_name)
+                if image is None:
+                    continue
+                try:
+                    image.pack()
+                    packed_count += 1
+                except Exception as e:
+                    print(f"[ImageManager] Error packing '{image_name}': {e}")
+            self._dirty_images.clear()
+
+        if packed_count > 0:
+            print(f"[ImageManager] Packed {packed_count} synced images")
+        return packed_count
+
     def load_or_create_image(self, image_name, file_path, project_size=None):
         """Thread-safe image update using queue and main thread processing"""
         try:
@@ -78,6 +108,126 @@ class ImageManager:
             print(f"[ImageManager] Error queuing image update '{image_name}': {e}")
             return None
 
+    def update_image_from_frame(self, frame):
+        """Thread-safe image update from a decoded TextureFrame"""
+        if threading.get_ident() == self._main_thread_id:
+            return self._process_frame_update(frame)
+
+        self._update_queue.put({"image_name": frame.image_name, "frame": frame})
+        return None
+
+    def _get_pixel_buffer(self, width, height, channels=4):
+        """Scratch float32 buffer for foreach_get/foreach_set, reused per size"""
+        key = (width, height, channels)
+        buffer = self._pixel_buffers.get(key)
+        if buffer is None:
+            buffer = np.empty(width * height * channels, dtype=np.float32)
+            self._pixel_buffers[key] = buffer
+        return buffer
+
+    def _convert_channels(self, buffer, channels, target_channels):
+        """Copy a flat pixel buffer into a pooled buffer with another channel count"""
+        pixel_count = len(buffer) // channels
+        converted = self._get_pixel_buffer(pixel_count, 1, target_channels)
+        source = buffer.reshape(-1, channels)
+        target = converted.reshape(-1, target_channels)
+        shared = min(channels, target_channels)
+        target[:, :shared] = source[:, :shared]
+        if target_channels > shared:
+            target[:, shared:] = 1.0
+        return converted
+
+    def _get_pixel_mirror(self, image, read=True):
+        """
+        Float32 (height, width, channels) copy of an image's pixels, kept in
+        sync with our own writes. With read=False a new mirror is left
+        uninitialized, for callers that overwrite every pixel.
+        """
+        width, height = image.size
+        shape = (height, width, image.channels)
+        size = width * height * image.channels
+        cached = self._pixel_mirrors.get(image.name)
+        if cached is not None and cached[0] == image.as_pointer():
+            if cached[1].shape == shape:
+                return cached[1]
+            mirror = cached[1]
+            if mirror.size >= size:
+                # Reuse the allocation when the image shrank
+                mirror = mirror.reshape(-1)[:size].reshape(shape)
+            else:
+                mirror = np.empty(shape, dtype=np.float32)
+        else:
+            mirror = np.empty(shape, dtype=np.float32)
+
+        if read:
+            image.pixels.foreach_get(mirror.reshape(-1))
+        self._pixel_mirrors[image.name] = (image.as_pointer(), mirror)
+        return mirror
+
+    def _request_full_sync(self, image_name):
+        if ImageManager.on_full_sync_needed:
+            ImageManager.on_full_sync_needed(image_name)
+
+    def _process_frame_update(self, frame):
+        """Write raw RGBA8 frame pixels into an image - main thread only"""
+        image_name = frame.image_name
+        try:
+            with ImageManager.UPDATING_IMAGE:
+                target_image = bpy.data.images.get(image_name)
+
+                if target_image is None:
+                    if not frame.full:
+                        self._request_full_sync(image_name)
+                        return None
+                    target_image = bpy.data.images.new(
+                        name=image_name,
+                        width=frame.width,
+                        height=frame.height,
+                        alpha=True,
+                    )
+                elif target_image.type in [
+                    "RENDER_RESULT",
+                    "COMPOSITING",
+                    "MULTILAYER",
+                ]:
+                    print(
+                        f"[ImageManager] Skipping protected image type: {target_image.type}"
+                    )
+                    return None
+                elif tuple(target_image.size) != (frame.width, frame.height):
+                    if not frame.full:
+                        self._request_full_sync(image_name)
+                        return None
+                    target_image.scale(frame.width, frame.height)
+
+                # Patch the mirror, then write it back in one foreach_set;
+                # slice assignment on image.pixels rewrites the whole buffer
+                # element by element
+                mirror = self._get_pixel_mirror(target_image, read=not frame.full)
+                # Frames are RGBA; images without alpha keep the leading channels
+                channels = mirror.shape[2]
+                for x, y, pixels in frame.patches:
+                    height, width = pixels.shape[:2]
+                    np.multiply(
+                        pixels[..., :channels],
+                        1.0 / 255.0,
+                        out=mirror[y : y + height, x : x + width],
+                    )
+                target_image.pixels.foreach_set(mirror.reshape(-1))
+
+                # Packing re-encodes the whole image, defer it until save
+                self._dirty_images.add(target_image.name)
+                if target_image.channels == 4:
+                    target_image.alpha_mode = "STRAIGHT"
+
+                target_image.update()
+                target_image.update_tag()
+                return target_image
+
+        except Exception as e:
+            print(f"[ImageManager] Error writing pixels to '{image_name}': {e}")
+            return None
+
     def _process_image_update(self, image_name, file_path, project_size=None):
         """Process image update in main thread - thread safe"""
         try:
@@ -109,8 +259,16 @@ class ImageManager:
                     if target_image.size != temp_image.size:
                         target_image.scale(temp_image.size[0], temp_image.size[1])
 
-                    # Copy pixels (thread safe pixel-level update)
-                    target_image.pixels = temp_image.pixels[:]
+                    # Copy pixels through a reusable float32 buffer
+                    width, height = temp_image.size
+                    channels = temp_image.channels
+                    buffer = self._get_pixel_buffer(width, height, channels)
+                    temp_image.pixels.foreach_get(buffer)
+                    if target_image.channels != channels:
+                        buffer = self._convert_channels(
+                            buffer, channels, target_image.channels
+                        )
+                    target_image.pixels.foreach_set(buffer)
 
                 else:
                     # Create new image
@@ -121,8 +279,11 @@ class ImageManager:
                 if temp_image != target_image:
                     bpy.data.images.remove(temp_image)
 
-                # Pack and set transparency
-                target_image.pack()
+                # Pixels changed behind the mirror used for dirty-rect updates
+                self._pixel_mirrors.pop(image_name, None)
+
+                # Packing re-encodes the whole image, defer it until save
+                self._dirty_images.add(target_image.name)
                 if target_image.channels == 4:
                     target_image.alpha_mode = "STRAIGHT"
 
@@ -150,29 +311,44 @@ class ImageManager:
         processed_count = 0
         update_requests = {}
 
-        # Collect all unique requests (latest version for each image)
+        # Collect requests per image; a full update makes older ones obsolete,
+        # while dirty-rect updates must all be applied in order
         try:
             while True:
                 request = self._update_queue.get_nowait()
                 image_name = request["image_name"]
-                # Keep only the latest request for each image
-                update_requests[image_name] = request
+                frame = request.get("frame")
+                if frame is None or frame.full:
+                    update_requests[image_name] = [request]
+                else:
+                    update_requests.setdefault(image_name, []).append(request)
         except queue.Empty:
             pass
 
         # Process collected requests
-        for image_name, request in update_requests.items():
-            try:
-                self._process_image_update(
-                    request["image_name"], request["file_path"], request["project_size"]
-                )
-                processed_count += 1
-            except Exception as e:
-                print(
-                    f"[ImageManager] Error processing queued update for '{image_name}': {e}"
-                )
+        for image_name, requests in update_requests.items():
+            for request in requests:
+                try:
+                    if "frame" in request:
+                        self._process_frame_update(request["frame"])
+                    else:
+                        self._process_image_update(
+                            image_name, request["file_path"], request["project_size"]
+                        )
+                    processed_count += 1
+                except Exception as e:
+                    print(
+                        f"[ImageManager] Error processing queued update for '{image_name}': {e}"
+                    )
 
         if processed_count > 0:
             print(f"[ImageManager] Processed {processed_count} pending image updates")
 
         return 0.1  # Return timer interval
+
+
+@persistent
+def pack_dirty_images_handler(*args):
+    """save_pre handler - store live synced pixels in the .blend"""
+    if ImageManager.INSTANCE:
+        ImageManager.INSTANCE.pack_dirty_images()
@@ -1,6 +1,7 @@
 import bpy
 
 from . import server
+from .image_manager import ImageManager
 
 
 class WORLD_OT_setup_grid(bpy.types.Operator):
@@ -60,3 +61,18 @@ class SERVER_OT_stop(bpy.types.Operator):
         self.report({"INFO"}, "Server stopped")
         server.stop_server()
         return {"FINISHED"}
+
+
+class IMAGE_OT_pack_synced_images(bpy.types.Operator):
+    bl_idname = "image.pack_synced_images"
+    bl_label = "Pack Synced Images"
+    bl_description = "Pack images changed by Pixelorama sync into the .blend file"
+
+    @classmethod
+    def poll(cls, context):
+        return ImageManager.INSTANCE is not None
+
+    def execute(self, context):
+        packed_count = ImageManager.INSTANCE.pack_dirty_images()
+        self.report({"INFO"}, f"Packed {packed_count} synced images")
+        return {"FINISHED"}
@@ -0,0 +1,190 @@
+"""
+Polygon clipping for UV overlap checks.
+Polygons are sequences of (x, y) points. Plain Python is used so the
+module also runs outside Blender; NumPy only speeds up batch helpers.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy ships with Blender
+    np = None
+
+# Pieces with a smaller area are treated as touching, not overlapping
+AREA_EPSILON = 1e-12
+
+
+def as_points(polygon):
+    """(x, y) tuples from a point sequence, an (n, 2) array or a flat array."""
+    if np is not None and isinstance(polygon, np.ndarray):
+        return [tuple(p) for p in polygon.reshape(-1, 2).tolist()]
+    polygon = list(polygon)
+    if polygon and not hasattr(polygon[0], "__len__"):
+        return list(zip(polygon[0::2], polygon[1::2]))
+    return [(p[0], p[1]) for p in polygon]
+
+
+def signed_area(points) -> float:
+    """Shoelace area, positive for counter-clockwise polygons."""
+    area = 0.0
+    x0, y0 = points[-1]
+    for x1, y1 in points:
+        area += x0 * y1 - x1 * y0
+        x0, y0 = x1, y1
+    return area * 0.5
+
+
+def polygon_areas(offsets, uvs):
+    """
+    Signed areas of a packed face list, face i owning
+    uvs[offsets[i]:offsets[i + 1]].
+    """
+    if np is None:
+        return [
+            signed_area(as_points(uvs[offsets[i] : offsets[i + 1]]))
+            for i in range(len(offsets) - 1)
+        ]
+
+    uvs = np.asarray(uvs, dtype=np.float64).reshape(-1, 2)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if len(offsets) < 2:
+        return np.empty(0, dtype=np.float64)
+    # Each loop pairs with the next one of its face, wrapping at the end
+    following = np.arange(1, len(uvs) + 1)
+    following[offsets[1:] - 1] = offsets[:-1]
+    cross = uvs[:, 0] * uvs[following, 1] - uvs[following, 0] * uvs[:, 1]
+    return np.add.reduceat(cross, offsets[:-1]) * 0.5
+
+
+def _cross(o, a, b) -> float:
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def is_convex(points, epsilon: float = 0.0) -> bool:
+    """True for counter-clockwise polygons without reflex corners."""
+    count = len(points)
+    return all(
+        _cross(points[i - 1], points[i], points[(i + 1) % count]) >= -epsilon
+        for i in range(count)
+    )
+
+
+def clip_convex(subject, clip, epsilon: float = 0.0):
+    """
+    Sutherland-Hodgman: the part of subject inside the convex,
+    counter-clockwise clip polygon. Points on clip edges count as inside.
+    """
+    output = list(subject)
+    count = len(clip)
+    for i in range(count):
+        if not output:
+            break
+        edge_start = clip[i]
+        edge_end = clip[(i + 1) % count]
+        edge_x = edge_end[0] - edge_start[0]
+        edge_y = edge_end[1] - edge_start[1]
+
+        points = output
+        output = []
+        previous = points[-1]
+        previous_side = edge_x * (previous[1] - edge_start[1]) - edge_y * (
+            previous[0] - edge_start[0]
+        )
+        for current in points:
+            side = edge_x * (current[1] - edge_start[1]) - edge_y * (
+                current[0] - edge_start[0]
+            )
+            if side >= -epsilon:
+                if previous_side < -epsilon:
+                    output.append(_intersect(previous, current, previous_side, side))
+                output.append(current)
+            elif previous_side >= -epsilon:
+                output.append(_intersect(previous, current, previous_side, side))
+            previous = current
+            previous_side = side
+
+    return output
+
+
+def _intersect(start, end, start_side, end_side):
+    t = start_side / (start_side - end_side)
+    return (start[0] + t * (end[0] - start[0]), start[1] + t * (end[1] - start[1]))
+
+
+def triangulate(points, epsilon: float = 0.0):
+    """Ear clipping of a simple counter-clockwise polygon into triangles."""
+    remaining = list(range(len(points)))
+    triangles = []
+    while len(remaining) > 3:
+        count = len(remaining)
+        for i in range(count):
+            a = points[remaining[i - 1]]
+            b = points[remaining[i]]
+            c = points[remaining[(i + 1) % count]]
+            if _cross(a, b, c) <= epsilon:
+                continue
+            if any(
+                _point_in_triangle(points[j], a, b, c)
+                for j in remaining
+                if points[j] not in (a, b, c)
+            ):
+                continue
+            triangles.append([a, b, c])
+            del remaining[i]
+            break
+        else:
+            # Degenerate or self-intersecting, fall back to a fan
+            triangles.extend(
+                [points[remaining[0]], points[remaining[i]], points[remaining[i + 1]]]
+                for i in range(1, count - 1)
+            )
+            return triangles
+
+    triangles.append([points[i] for i in remaining])
+    return triangles
+
+
+def _point_in_triangle(p, a, b, c) -> bool:
+    return _cross(a, b, p) >= 0 and _cross(b, c, p) >= 0 and _cross(c, a, p) >= 0
+
+
+def convex_pieces(points, epsilon: float = 0.0):
+    """Split a counter-clockwise polygon into convex pieces."""
+    if len(points) <= 3 or is_convex(points, epsilon):
+        return [points]
+    return triangulate(points, epsilon)
+
+
+def intersect_polygons(clip, subject, epsilon: float = 0.0):
+    """
+    Overlap of two polygons of any winding. Triangles and convex quads are
+    clipped directly; other polygons are split into convex pieces first.
+    Returns (pieces, area) where pieces are counter-clockwise polygons.
+    """
+    clip = as_points(clip)
+    subject = as_points(subject)
+    if len(clip) < 3 or len(subject) < 3:
+        return [], 0.0
+    clip_area = signed_area(clip)
+    subject_area = signed_area(subject)
+    # A collapsed polygon has no inside; clipping against it would keep
+    # the whole subject since every point lies on its edges
+    if abs(clip_area) <= AREA_EPSILON or abs(subject_area) <= AREA_EPSILON:
+        return [], 0.0
+    if clip_area < 0:
+        clip.reverse()
+    if subject_area < 0:
+        subject.reverse()
+
+    pieces = []
+    area = 0.0
+    for clip_piece in convex_pieces(clip, epsilon):
+        for subject_piece in convex_pieces(subject, epsilon):
+            piece = clip_convex(subject_piece, clip_piece, epsilon)
+            if len(piece) < 3:
+                continue
+            piece_area = signed_area(piece)
+            if piece_area > AREA_EPSILON:
+                pieces.append(piece)
+                area += piece_area
+
+    return pieces, area
@@ -2,20 +2,80 @@ import asyncio
 import json
 import threading
 import traceback
+from collections import OrderedDict
 
 import websockets
+from websockets.protocol import State
 
 connected_clients = set()
+client_outboxes = {}
 server_thread = None
 server_loop = None
 server_running = False
 stop_event = None
 websocket_server = None
 
+# Message types describing state: a newer pending message replaces an older one
+COALESCED_MESSAGE_TYPES = {"GET_UV_OVERLAY", "GET_IMAGES"}
+# Pending messages per client before the oldest ones are dropped
+MAX_PENDING_MESSAGES = 64
+# Write buffer size above which broadcast frames skip a client
+BROADCAST_BUFFER_LIMIT = 1024 * 1024
+
+broadcast_stats = {"sent": 0, "dropped": 0}
+
 # Callback for Blender integration (called from Blender's main thread)
 on_client_connected_callback = None
 on_client_disconnected_callback = None
 on_message_received_callback = None
+on_binary_received_callback = None
+
+
+class ClientOutbox:
+    """Bounded send queue of one client, drained by its own writer task"""
+
+    def __init__(self, websocket, client_info):
+        self.websocket = websocket
+        self.client_info = client_info
+        self.pending = OrderedDict()
+        self.wakeup = asyncio.Event()
+        self.next_key = 0
+        self.dropped = 0
+        self.task = None
+
+    def put(self, data, coalesce_key=None):
+        if coalesce_key is None:
+            coalesce_key = self.next_key
+            self.next_key += 1
+        else:
+            # Latest wins: drop the stale message and queue the new one last
+            self.pending.pop(coalesce_key, None)
+        self.pending[coalesce_key] = data
+
+        while len(self.pending) > MAX_PENDING_MESSAGES:
+            self.pending.popitem(last=False)
+            self.dropped += 1
+        self.wakeup.set()
+
+    async def run(self):
+        try:
+            while True:
+                await self.wakeup.wait()
+                self.wakeup.clear()
+                while self.pending:
+                    _, data = self.pending.popitem(last=False)
+                    await self.websocket.send(data)
+        except websockets.exceptions.ConnectionClosed:
+            # The handler notices the closed connection and cleans up
+            pass
+
+    def start(self):
+        self.task = asyncio.create_task(self.run())
+
+    def stop(self):
+        if self.task:
+            self.task.cancel()
+            self.task = None
 
 
 async def ws_handler(websocket):
@@ -36,11 +96,21 @@ async def ws_handler(websocket):
         }
         await websocket.send(json.dumps(welcome_msg))
 
+        outbox = ClientOutbox(websocket, client_info)
+        client_outboxes[websocket] = outbox
+        outbox.start()
+
         # Trigger Blender callback if set
         if on_client_connected_callback:
             on_client_connected_callback(client_info, websocket)
 
         async for message in websocket:
+            if isinstance(message, bytes):
+                # Binary frames carry raw payloads such as texture pixels
+                if on_binary_received_callback:
+                    on_binary_received_callback(client_info, message)
+                continue
+
             print(f"Received from client {client_info}: {message}")
             try:
                 # Parse message to see if it's a specific request
@@ -64,6 +134,11 @@ async def ws_handler(websocket):
     finally:
         # Remove client from connection list
         connected_clients.discard(websocket)
+        outbox = client_outboxes.pop(websocket, None)
+        if outbox:
+            outbox.stop()
+            if outbox.dropped:
+                print(f"Client {client_info} dropped {outbox.dropped} queued messages")
         print(f"Client {client_info} removed. Total clients: {len(connected_clients)}")
 
 
@@ -84,7 +159,7 @@ def start_server_async():
             ping_interval=20,  # Send ping every 20 seconds
             ping_timeout=10,  # Ping timeout 10 seconds
             close_timeout=1,  # Close timeout 1 second
-            max_size=10**7,  # Max message size 10MB
+            max_size=2**27,  # Max message size 128MB, fits raw 4096x4096 RGBA8
             max_queue=32,  # Max queue 32
             compression=None,  # Disable compression for stability
         )
@@ -141,21 +216,61 @@ def get_server_status():
         "running": server_running,
         "clients_count": len(connected_clients),
         "loop_active": server_loop is not None,
+        "broadcast_sent": broadcast_stats["sent"],
+        "broadcast_dropped": broadcast_stats["dropped"],
     }
 
 
-def set_callbacks(on_connected=None, on_disconnected=None, on_message=None):
+def set_callbacks(
+    on_connected=None, on_disconnected=None, on_message=None, on_binary=None
+):
     """Set callback functions for Blender integration"""
     global \
         on_client_connected_callback, \
         on_client_disconnected_callback, \
-        on_message_received_callback
+        on_message_received_callback, \
+        on_binary_received_callback
     on_client_connected_callback = on_connected
     on_client_disconnected_callback = on_disconnected
     on_message_received_callback = on_message
+    on_binary_received_callback = on_binary
+
+
+def _broadcast(message_data, client=None):
+    """Write one encoded message to all open clients without awaiting them"""
+    receivers = []
+    for ws in connected_clients:
+        if client is not None and _client_info(ws) != client:
+            continue
+        transport = ws.transport
+        if ws.state is not State.OPEN or (
+            transport and transport.get_write_buffer_size() > BROADCAST_BUFFER_LIMIT
+        ):
+            broadcast_stats["dropped"] += 1
+            continue
+        receivers.append(ws)
 
+    websockets.broadcast(receivers, message_data)
+    broadcast_stats["sent"] += len(receivers)
 
-def send_message(msg):
+
+def _client_info(websocket):
+    outbox = client_outboxes.get(websocket)
+    return outbox.client_info if outbox else None
+
+
+def send_message(msg, coalesce_key=None, broadcast=False, client=None):
+    """
+    Queue msg for every client: dicts are sent as JSON text, bytes as a
+    binary frame. Messages sharing a coalesce_key replace each other while
+    pending; JSON messages of COALESCED_MESSAGE_TYPES coalesce by type.
+
+    With broadcast=True the message bypasses the client queues and is
+    written to every client at once; clients that are closing or whose
+    write buffer is full miss it.
+
+    client restricts either mode to the client with that client_info.
+    """
     if server_loop is None:
         print("Server not running - cannot send message")
         return False
@@ -164,39 +279,24 @@ def send_message(msg):
         print("No clients connected - cannot send message")
         return False
 
-    async def _send():
-        # Broadcast to all clients
-        dead_clients = set()
+    if isinstance(msg, (bytes, bytearray)):
+        message_data = bytes(msg)
+    else:
         message_data = json.dumps(msg)
+        if coalesce_key is None and msg.get("type") in COALESCED_MESSAGE_TYPES:
+            coalesce_key = msg["type"]
 
-        for ws in connected_clients:
-            try:
-                await ws.send(message_data)
-                print(f"Message sent to {ws.remote_address[0]}:{ws.remote_address[1]}")
-            except websockets.exceptions.ConnectionClosed as e:
-                print(
-                    f"Client {ws.remote_address[0]}:{ws.remote_address[1]} connection closed during send - Code: {e.code}"
-                )
-                dead_clients.add(ws)
-            except Exception as e:
-                print(
-                    f"Error sending to client {ws.remote_address[0]}:{ws.remote_address[1]}: {e}"
-                )
-                dead_clients.add(ws)
-
-        # Clean up disconnected clients
-        for ws in dead_clients:
-            connected_clients.discard(ws)
-            print(f"Removed dead client {ws.remote_address[0]}:{ws.remote_address[1]}")
-
-        if dead_clients:
-            print(
-                f"Cleaned up {len(dead_clients)} dead connections. Active clients: {len(connected_clients)}"
-            )
+    def _enqueue():
+        for outbox in client_outboxes.values():
+            if client is None or outbox.client_info == client:
+                outbox.put(message_data, coalesce_key)
 
     try:
-        # Safe call in server thread
-        server_loop.call_soon_threadsafe(asyncio.create_task, _send())
+        # Clients are only touched from the server thread
+        if broadcast:
+            server_loop.call_soon_threadsafe(_broadcast, message_data, client)
+        else:
+            server_loop.call_soon_threadsafe(_enqueue)
         return True
     except Exception as e:
         print(f"Failed to queue message for sending: {e}")
@@ -4,11 +4,15 @@ Provides pixel-level texture operations and check functionality.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Tuple
 
 import bpy
+import numpy as np
 from mathutils import Matrix, Vector
 
+from .uv_arrays import get_loop_island_labels, has_active_uv_layer
+from .uv_extractor import read_object_loop_vertex_indices, uv_object_cache
+
 
 @dataclass(frozen=True)
 class Vector2Int:
@@ -89,45 +93,65 @@ class RectInt:
 
 
 class PixelArray:
-    """Pixel-level texture manipulation class adapted from Pixel-Unwrapper."""
+    """
+    Pixel-level texture manipulation class adapted from Pixel-Unwrapper.
+    Pixels are kept in a contiguous (height, width, 4) float32 array with
+    Blender's bottom-left origin.
+    """
 
     def __init__(self, blender_image=None, size: int = None):
         if blender_image is not None:
             self.width = blender_image.size[0]
             self.height = blender_image.size[1]
-            self.pixels = list(blender_image.pixels[:])
-            assert len(self.pixels) == self.width * self.height * 4, (
+            self.pixels = np.empty((self.height, self.width, 4), dtype=np.float32)
+            assert len(blender_image.pixels) == self.pixels.size, (
                 "Pixels array is not the right size"
             )
+            blender_image.pixels.foreach_get(self.pixels.reshape(-1))
         elif size is not None:
             # Create a default checkerboard pattern
             self.width = self.height = size
-            pixels = list()
-            for i in range(size * size):
-                row = i // size
-                col = i % size
-                # Simple checkerboard pattern
-                if (row + col) % 2 == 0:
-                    col_val = [0.8, 0.8, 0.8, 1.0]  # Light gray
-                else:
-                    col_val = [0.4, 0.4, 0.4, 1.0]  # Dark gray
-                pixels.extend(col_val)
-            self.pixels = pixels
+            light = (np.add.outer(np.arange(size), np.arange(size)) % 2) == 0
+            self.pixels = np.where(
+                light[..., None],
+                np.array([0.8, 0.8, 0.8, 1.0], dtype=np.float32),  # Light gray
+                np.array([0.4, 0.4, 0.4, 1.0], dtype=np.float32),  # Dark gray
+            )
+
+    def save(self, blender_image) -> None:
+        """Write the pixels back to an image of the same size."""
+        assert tuple(blender_image.size) == (self.width, self.height), (
+            "Image size doesn't match the pixel array"
+        )
+        blender_image.pixels.foreach_set(self.pixels.reshape(-1))
+        blender_image.update()
 
     def get_pixel(self, x: int, y: int) -> Tuple[float, float, float, float]:
         """Get pixel RGBA values with wrap mode."""
-        x = x % self.width
-        y = y % self.height
-        idx = (y * self.width + x) * 4
-        return tuple(self.pixels[idx : idx + 4])
+        return tuple(self.pixels[y % self.height, x % self.width].tolist())
 
     def set_pixel(self, x: int, y: int, pix: Tuple[float, float, float, float]) -> None:
         """Set pixel RGBA values with wrap mode."""
-        x = x % self.width
-        y = y % self.height
-        idx = (y * self.width + x) * 4
         assert len(pix) == 4
-        self.pixels[idx : idx + 4] = pix
+        self.pixels[y % self.height, x % self.width] = pix
+
+    def read_region(self, x: int, y: int, width: int, height: int) -> np.ndarray:
+        """Copy of a (height, width, 4) block with wrap mode."""
+        if 0 <= x and x + width <= self.width and 0 <= y and y + height <= self.height:
+            return self.pixels[y : y + height, x : x + width].copy()
+        rows = np.arange(y, y + height) % self.height
+        cols = np.arange(x, x + width) % self.width
+        return self.pixels[np.ix_(rows, cols)]
+
+    def write_region(self, x: int, y: int, block: np.ndarray) -> None:
+        """Write a (height, width, 4) block with wrap mode."""
+        height, width = block.shape[:2]
+        if 0 <= x and x + width <= self.width and 0 <= y and y + height <= self.height:
+            self.pixels[y : y + height, x : x + width] = block
+            return
+        rows = np.arange(y, y + height) % self.height
+        cols = np.arange(x, x + width) % self.width
+        self.pixels[np.ix_(rows, cols)] = block
 
     def copy_region(
         self,
@@ -138,14 +162,23 @@ class PixelArray:
     ) -> None:
         """
         Copy a region of the source texture to this one.
-        The source texture uses wrap mode repeat.
+        The source texture uses wrap mode repeat, the destination is
+        clipped to this texture.
         """
-        matrix = Matrix.Identity(3)
-        offset = dst_pos - src_pos
-        src_rect = RectInt(src_pos, src_pos + size)
-        matrix[0][2] = offset.x
-        matrix[1][2] = offset.y
-        self.copy_region_transformed(source, src_rect, matrix)
+        dst_min_x = max(0, dst_pos.x)
+        dst_min_y = max(0, dst_pos.y)
+        dst_max_x = min(self.width, dst_pos.x + size.x)
+        dst_max_y = min(self.height, dst_pos.y + size.y)
+        if dst_min_x >= dst_max_x or dst_min_y >= dst_max_y:
+            return
+
+        block = source.read_region(
+            src_pos.x + dst_min_x - dst_pos.x,
+            src_pos.y + dst_min_y - dst_pos.y,
+            dst_max_x - dst_min_x,
+            dst_max_y - dst_min_y,
+        )
+        self.pixels[dst_min_y:dst_max_y, dst_min_x:dst_max_x] = block
 
     def copy_region_transformed(
         self,
@@ -154,7 +187,7 @@ class PixelArray:
         transform: Matrix,
     ) -> None:
         """Copy and transform a region from source to this pixel array."""
-        original_pixels_len = len(self.pixels)
+        original_shape = self.pixels.shape
 
         # Determine bounds of the destination area
         half = Vector((0.5, 0.5, 0))
@@ -181,28 +214,45 @@ class PixelArray:
         dst_max_x = min(self.width, ceil(max(bl.x, br.x, tl.x, tr.x)))
         dst_max_y = min(self.height, ceil(max(bl.y, br.y, tl.y, tr.y)))
 
-        # Get inverse transform for sampling
-        inv_transform = transform.inverted()
+        if dst_min_x >= dst_max_x or dst_min_y >= dst_max_y:
+            return
+
+        # Map all destination pixel centers back to the source at once
+        inv_transform = np.array(transform.inverted(), dtype=np.float64)
+        xs = np.arange(dst_min_x, dst_max_x, dtype=np.float64) + 0.5
+        ys = np.arange(dst_min_y, dst_max_y, dtype=np.float64)[:, None] + 0.5
+        src_x = inv_transform[0, 0] * xs + inv_transform[0, 1] * ys + inv_transform[0, 2]
+        src_y = inv_transform[1, 0] * xs + inv_transform[1, 1] * ys + inv_transform[1, 2]
 
-        for y in range(dst_min_y, dst_max_y):
-            for x in range(dst_min_x, dst_max_x):
-                src_point = inv_transform @ Vector((x + 0.5, y + 0.5, 1))
-                # Nearest neighbor interpolation
-                pix = source.get_pixel(floor(src_point.x), floor(src_point.y))
-                self.set_pixel(x, y, pix)
+        # Nearest neighbor interpolation, source in wrap mode
+        cols = np.floor(src_x).astype(np.int64) % source.width
+        rows = np.floor(src_y).astype(np.int64) % source.height
+        self.pixels[dst_min_y:dst_max_y, dst_min_x:dst_max_x] = source.pixels[rows, cols]
 
-        assert len(self.pixels) == original_pixels_len, (
-            f"Pixel Array was resized (from {original_pixels_len} to {len(self.pixels)})"
+        assert self.pixels.shape == original_shape, (
+            f"Pixel Array was resized (from {original_shape} to {self.pixels.shape})"
         )
 
 
 class TextureProcessor:
     """Main texture processing class with checktexture functionality."""
 
+    # Rows analyzed at a time, bounds the temporaries of the integrity check
+    # on top of the full pixel copy
+    CHECK_BAND_ROWS = 256
+    # Unique colors are only counted up to this many
+    MAX_TRACKED_COLORS = 65536
+
     @staticmethod
-    def check_texture_integrity(image: bpy.types.Image) -> dict:
+    def check_texture_integrity(image: bpy.types.Image, palette=None) -> dict:
         """
         Check texture for common issues and return a report.
+        palette is an optional list of RGB(A) colors in 0-1; pixels using
+        other colors are counted.
+
+        The pixels are read once into a full float32 copy, since
+        foreach_get can't read part of an image; only the analysis runs in
+        row bands.
         """
         if not image:
             return {"status": "error", "message": "No image provided"}
@@ -219,6 +269,7 @@ class TextureProcessor:
         # Check for common issues
         if image.size[0] == 0 or image.size[1] == 0:
             report["issues"].append("Image has zero dimension")
+            return report
 
         if image.channels < 4:
             report["issues"].append("Image doesn't have alpha channel")
@@ -226,76 +277,160 @@ class TextureProcessor:
         if not image.pixels:
             report["issues"].append("Image has no pixel data")
 
-        # Check for solid transparent areas
         try:
             pixel_array = PixelArray(image)
-            transparent_pixels = 0
-            total_pixels = pixel_array.width * pixel_array.height
-
-            for y in range(pixel_array.height):
-                for x in range(pixel_array.width):
-                    _, _, _, a = pixel_array.get_pixel(x, y)
-                    if a < 0.01:
-                        transparent_pixels += 1
-
-            transparency_ratio = transparent_pixels / total_pixels
-            if transparency_ratio > 0.95:
-                report["issues"].append(
-                    f"Image is almost entirely transparent ({transparency_ratio:.1%})"
-                )
-            elif transparency_ratio < 0.01:
-                report["issues"].append(
-                    f"Image has almost no transparency ({transparency_ratio:.1%})"
-                )
-
+            stats = TextureProcessor._scan_pixels(pixel_array.pixels, palette)
+            report["stats"] = stats
         except Exception as e:
             report["issues"].append(f"Failed to analyze pixels: {str(e)}")
+            return report
+
+        # Check for solid transparent areas
+        transparency_ratio = stats["transparent_pixels"] / stats["total_pixels"]
+        if transparency_ratio > 0.95:
+            report["issues"].append(
+                f"Image is almost entirely transparent ({transparency_ratio:.1%})"
+            )
+        elif transparency_ratio < 0.01:
+            report["issues"].append(
+                f"Image has almost no transparency ({transparency_ratio:.1%})"
+            )
+
+        if stats["non_palette_pixels"]:
+            report["issues"].append(
+                f"{stats['non_palette_pixels']} pixels use colors outside the palette"
+            )
+
+        if stats["likely_premultiplied"] and image.alpha_mode == "STRAIGHT":
+            report["issues"].append(
+                "Colors look premultiplied but the image alpha mode is Straight"
+            )
 
         return report
 
+    @staticmethod
+    def _scan_pixels(pixels: np.ndarray, palette=None) -> dict:
+        """Statistics of a (height, width, 4) float image, one row band at a time."""
+        height, width = pixels.shape[:2]
+        alpha_histogram = np.zeros(256, dtype=np.int64)
+        opaque_columns = np.zeros(width, dtype=bool)
+        transparent_rows = 0
+        transparent_pixels = 0
+        semi_transparent_pixels = 0
+        straight_alpha_pixels = 0
+        non_palette_pixels = 0
+        colors = np.empty(0, dtype=np.uint32)
+        colors_capped = False
+
+        palette_colors = None
+        if palette is not None:
+            palette_rgba = np.array(
+                [tuple(color) + (1.0,) * (4 - len(color)) for color in palette],
+                dtype=np.float64,
+            ).reshape(-1, 4)
+            palette_colors = (
+                np.rint(np.clip(palette_rgba, 0.0, 1.0) * 255)
+                .astype(np.uint8)
+                .view(np.uint32)
+                .reshape(-1)
+            )
+
+        for start in range(0, height, TextureProcessor.CHECK_BAND_ROWS):
+            band = pixels[start : start + TextureProcessor.CHECK_BAND_ROWS]
+            band8 = np.rint(np.clip(band, 0.0, 1.0) * 255).astype(np.uint8)
+            alpha8 = band8[..., 3]
+            alpha = band[..., 3]
+
+            alpha_histogram += np.bincount(alpha8.reshape(-1), minlength=256)
+            transparent = alpha < 0.01
+            transparent_pixels += np.count_nonzero(transparent)
+            transparent_rows += np.count_nonzero(transparent.all(axis=1))
+            opaque_columns |= ~transparent.all(axis=0)
+
+            # Straight alpha may store color brighter than alpha, premultiplied can't
+            semi = ~transparent & (alpha < 0.99)
+            semi_transparent_pixels += np.count_nonzero(semi)
+            over_alpha = (band[..., :3] > alpha[..., None] + 1.0 / 255.0).any(axis=2)
+            straight_alpha_pixels += np.count_nonzero(semi & over_alpha)
+
+            packed = band8.view(np.uint32).reshape(-1)
+            if palette_colors is not None:
+                off_palette = ~np.isin(packed, palette_colors) & (alpha8.reshape(-1) > 0)
+                non_palette_pixels += np.count_nonzero(off_palette)
+
+            if not colors_capped:
+                colors = np.union1d(colors, packed)
+                if len(colors) > TextureProcessor.MAX_TRACKED_COLORS:
+                    colors_capped = True
+
+        return {
+            "total_pixels": width * height,
+            "transparent_pixels": int(transparent_pixels),
+            "semi_transparent_pixels": int(semi_transparent_pixels),
+            "alpha_histogram": alpha_histogram.reshape(16, 16).sum(axis=1).tolist(),
+            "transparent_rows": int(transparent_rows),
+            "transparent_columns": int(width - np.count_nonzero(opaque_columns)),
+            "unique_colors": len(colors),
+            "unique_colors_capped": colors_capped,
+            "non_palette_pixels": int(non_palette_pixels),
+            "likely_premultiplied": bool(
+                semi_transparent_pixels > 0 and straight_alpha_pixels == 0
+            ),
+        }
+
+    # Quadrant colors of the checker (top-left, top-right, bottom-left,
+    # bottom-right), kept dark for better UV editor visibility
+    CHECKER_COLORS = (
+        (0.35, 0.28, 0.2, 1.0),  # Dark orange-brown
+        (0.2, 0.28, 0.35, 1.0),  # Dark blue-gray
+        (0.25, 0.32, 0.2, 1.0),  # Dark olive green
+        (0.35, 0.2, 0.28, 1.0),  # Dark dusty rose
+    )
+    # Color scale of every other pixel, low contrast for pixel-level distinction
+    CHECKER_DARK_FACTOR = 0.85
+    # Custom property identifying generated checker images for reuse
+    CHECKER_KEY_PROPERTY = "pixelorama_checker_key"
+
+    @staticmethod
+    def create_checkerboard_pixels(size: int, colors=None) -> np.ndarray:
+        """
+        (size, size, 4) float32 checker based on Pixel-Unwrapper: a 16x16 grid
+        of four colored quadrants with alternating pixel brightness.
+        """
+        colors = np.array(colors or TextureProcessor.CHECKER_COLORS, dtype=np.float32)
+        coords = np.arange(size)
+        left = (coords % 16) < 8
+        top = (coords % 16) < 8
+
+        # Quadrant index per pixel: 0 tl, 1 tr, 2 bl, 3 br
+        quadrant = (~top)[:, None] * 2 + (~left)[None, :]
+        pixels = colors[quadrant]
+
+        dark = (coords[:, None] + coords[None, :]) % 2 == 1
+        pixels[dark, :3] *= TextureProcessor.CHECKER_DARK_FACTOR
+        return pixels
+
     @staticmethod
     def create_checkerboard_texture(
-        size: int = 64, name: str = "CheckTexture"
+        size: int = 64, name: str = "CheckTexture", colors=None
     ) -> bpy.types.Image:
         """
         Create a pixel-perfect checkerboard texture based on Pixel-Unwrapper with real colors.
+        An existing checker with the same size and colors is reused.
         """
-        # Create the pixel-perfect pattern with Pixel-Unwrapper colors
-        pixels = []
-        for i in range(size * size):
-            row = i // size
-            col = i % size
-            # 16x16 grid with 4-color pattern like Pixel-Unwrapper
-            left = (col % 16) < 8
-            top = (row % 16) < 8
-            light = (row + col) % 2 == 0
-
-            # Define 4 corner colors with much lower brightness for better UV editor visibility
-            col_tl = [0.35, 0.28, 0.2, 1.0]  # Dark orange-brown top-left
-            col_tr = [0.2, 0.28, 0.35, 1.0]  # Dark blue-gray top-right
-            col_bl = [0.25, 0.32, 0.2, 1.0]  # Dark olive green bottom-left
-            col_br = [0.35, 0.2, 0.28, 1.0]  # Dark dusty rose bottom-right
-
-            if left:
-                if top:
-                    col_val = col_tl
-                else:
-                    col_val = col_bl
-            else:
-                if top:
-                    col_val = col_tr
-                else:
-                    col_val = col_br
-
-            # Create subtle variation for pixel-level distinction with minimal contrast
-            if not light:
-                col_val = [
-                    c * 0.85 for c in col_val
-                ]  # Further reduced for even lower contrast
-                col_val[3] = 1.0  # Keep alpha at 1.0
+        colors = tuple(
+            tuple(color) for color in colors or TextureProcessor.CHECKER_COLORS
+        )
+        key = f"{size}:" + ",".join(f"{c:.4f}" for color in colors for c in color)
 
-            pixels.extend(col_val)
+        for image in bpy.data.images:
+            if (
+                image.get(TextureProcessor.CHECKER_KEY_PROPERTY) == key
+                and tuple(image.size) == (size, size)
+            ):
+                return image
 
+        pixels = TextureProcessor.create_checkerboard_pixels(size, colors)
         new_texture = bpy.data.images.new(
             name=name,
             width=size,
@@ -303,7 +438,8 @@ class TextureProcessor:
             alpha=True,
         )
 
-        new_texture.pixels = pixels
+        new_texture.pixels.foreach_set(pixels.reshape(-1))
+        new_texture[TextureProcessor.CHECKER_KEY_PROPERTY] = key
         new_texture.update()
 
         return new_texture
@@ -320,16 +456,15 @@ class TextureProcessor:
         Returns True on success, False on failure.
         """
         try:
-            src_pixels = PixelArray(blender_image=texture)
-            dst_pixels = PixelArray(blender_image=texture)
+            # read_region() copies, so source and destination can be shared
+            pixels = PixelArray(blender_image=texture)
 
             src_pos_vec = Vector2Int(src_pos[0], src_pos[1])
             size_vec = Vector2Int(size[0], size[1])
             dst_pos_vec = Vector2Int(dst_pos[0], dst_pos[1])
 
-            dst_pixels.copy_region(src_pixels, src_pos_vec, size_vec, dst_pos_vec)
-            texture.pixels = dst_pixels.pixels
-            texture.update()
+            pixels.copy_region(pixels, src_pos_vec, size_vec, dst_pos_vec)
+            pixels.save(texture)
 
             return True
         except Exception as e:
@@ -338,45 +473,105 @@ class TextureProcessor:
 
     @staticmethod
     def validate_texture_coordinates(
-        uv_coords: List[Tuple[float, float]], texture_size: Tuple[int, int]
+        uv_coords,
+        texture_size: Tuple[int, int],
+        island_labels=None,
+        snap_tolerance: float = 1e-3,
     ) -> dict:
         """
         Validate UV coordinates against texture dimensions.
+        uv_coords is an (n, 2) array-like; island_labels optionally gives an
+        island index per UV for the per-island summary. snap_tolerance is in
+        texels.
         """
-        if not uv_coords:
+        uvs = np.asarray(uv_coords, dtype=np.float64).reshape(-1, 2)
+        if not len(uvs):
             return {"status": "error", "message": "No UV coordinates provided"}
 
+        tex_size = np.asarray(texture_size, dtype=np.float64)
+        texels = uvs * tex_size
+        # Texel containing each UV; UVs on the far edges belong to the last one
+        pixel_coords = np.clip(
+            np.floor(texels).astype(np.int64), 0, np.asarray(texture_size) - 1
+        )
+
+        # Check for UVs outside [0, 1] and ones that would sample outside the
+        # texture. Texel corners run from 0 to size, so a snapped UV on the
+        # right or top edge is inside
+        masks = {
+            "u_out_of_range": (uvs[:, 0] < 0) | (uvs[:, 0] > 1),
+            "v_out_of_range": (uvs[:, 1] < 0) | (uvs[:, 1] > 1),
+            "outside_texture": ((texels < 0) | (texels > tex_size)).any(axis=1),
+            "off_grid": (np.abs(texels - np.rint(texels)) > snap_tolerance).any(axis=1),
+        }
+        counts = {name: int(np.count_nonzero(mask)) for name, mask in masks.items()}
+        counts["total"] = len(uvs)
+
         issues = []
-        tex_width, tex_height = texture_size
-
-        for i, (u, v) in enumerate(uv_coords):
-            if u < 0 or u > 1:
-                issues.append(f"UV {i}: U coordinate {u} is outside [0, 1] range")
-            if v < 0 or v > 1:
-                issues.append(f"UV {i}: V coordinate {v} is outside [0, 1] range")
-
-        # Check for UVs that would sample outside texture bounds
-        pixel_coords = []
-        for u, v in uv_coords:
-            px = int(u * tex_width)
-            py = int(v * tex_height)
-            pixel_coords.append((px, py))
-
-            if px < 0 or px >= tex_width:
-                issues.append(
-                    f"UV {i}: Pixel X coordinate {px} is outside texture bounds"
-                )
-            if py < 0 or py >= tex_height:
-                issues.append(
-                    f"UV {i}: Pixel Y coordinate {py} is outside texture bounds"
-                )
+        if counts["u_out_of_range"]:
+            issues.append(f"{counts['u_out_of_range']} UVs have U outside [0, 1]")
+        if counts["v_out_of_range"]:
+            issues.append(f"{counts['v_out_of_range']} UVs have V outside [0, 1]")
+        if counts["outside_texture"]:
+            issues.append(
+                f"{counts['outside_texture']} UVs sample outside the texture bounds"
+            )
+        if counts["off_grid"]:
+            issues.append(f"{counts['off_grid']} UVs are not snapped to texel corners")
 
-        return {
+        report = {
             "status": "success" if not issues else "warning",
             "issues": issues,
+            "counts": counts,
             "pixel_coordinates": pixel_coords,
         }
 
+        if island_labels is not None:
+            labels = np.asarray(island_labels, dtype=np.int64)
+            island_count = int(labels.max()) + 1 if len(labels) else 0
+            island_counts = {"total": np.bincount(labels, minlength=island_count)}
+            for name, mask in masks.items():
+                island_counts[name] = np.bincount(
+                    labels[mask], minlength=island_count
+                )
+            report["islands"] = [
+                {name: int(values[island]) for name, values in island_counts.items()}
+                for island in range(island_count)
+            ]
+            for island, summary in enumerate(report["islands"]):
+                if summary["outside_texture"] or summary["off_grid"]:
+                    issues.append(
+                        f"Island {island}: {summary['outside_texture']} UVs outside "
+                        f"the texture, {summary['off_grid']} off the texel grid"
+                    )
+
+        return report
+
+    @staticmethod
+    def validate_objects(
+        objects, texture_size: Tuple[int, int], islands: bool = False, **kwargs
+    ) -> dict:
+        """
+        validate_texture_coordinates() for every loop of each mesh object,
+        reading UVs through the overlay cache. With islands=True the reports
+        include per-island summaries. Returns reports by object name.
+        """
+        reports = {}
+        for obj in objects:
+            if obj.type != "MESH" or not has_active_uv_layer(obj):
+                continue
+            arrays = uv_object_cache.get_entry(obj)["arrays"]
+            if arrays.loop_count == 0:
+                continue
+            if islands:
+                kwargs["island_labels"] = get_loop_island_labels(
+                    arrays, read_object_loop_vertex_indices(obj)
+                )
+            reports[obj.name] = TextureProcessor.validate_texture_coordinates(
+                arrays.uvs, texture_size, **kwargs
+            )
+        return reports
+
 
 # Blender operator for texture checking
 class TEXTURE_OT_check_texture(bpy.types.Operator):
@@ -429,6 +624,20 @@ class TEXTURE_OT_check_texture(bpy.types.Operator):
             else:
                 message += " - No issues found"
 
+            stats = report.get("stats")
+            if stats:
+                colors = f"{stats['unique_colors']}"
+                if stats["unique_colors_capped"]:
+                    colors = f">{TextureProcessor.MAX_TRACKED_COLORS}"
+                print(
+                    f"Texture Stats: {colors} colors, "
+                    f"{stats['transparent_pixels']} transparent and "
+                    f"{stats['semi_transparent_pixels']} semi-transparent pixels, "
+                    f"{stats['transparent_rows']} empty rows, "
+                    f"{stats['transparent_columns']} empty columns"
+                )
+                print(f"Texture Alpha Histogram (16 bins): {stats['alpha_histogram']}")
+
             self.report({"INFO"}, message)
 
         return {"FINISHED"}
@@ -454,7 +663,7 @@ class TEXTURE_OT_create_checker_texture(bpy.types.Operator):
 
         # Create checker texture
         checker_texture = TextureProcessor.create_checkerboard_texture(
-            size=texture_size, name=f"CheckerTexture_{obj.name}"
+            size=texture_size, name=f"CheckerTexture_{texture_size}"
         )
 
         # Get or create material
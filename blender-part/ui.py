@@ -1,5 +1,6 @@
 import bpy
 
+from .image_manager import ImageManager
 from .server import get_server_status
 
 
@@ -25,10 +26,15 @@ class WS_PT_ServerPanel(bpy.types.Panel):
                 status_icon = "PAUSE"
 
             box.label(text=status_text, icon=status_icon)
+            if ImageManager.INSTANCE and ImageManager.INSTANCE.has_dirty_images():
+                box.label(text="Synced images not packed yet", icon="UNLINKED")
             # Control buttons
             layout.separator()
             layout.operator("server.start", text="Start Server")
             layout.operator("server.stop", text="Stop Server")
+            layout.operator(
+                "image.pack_synced_images", text="Pack Synced Images", icon="PACKAGE"
+            )
 
 
 class WS_PT_UVToolsPanel(bpy.types.Panel):
@@ -47,6 +53,15 @@ class WS_PT_UVToolsPanel(bpy.types.Panel):
             layout.operator("uv.unwrap_pixel_perfect", text="Pixel Perfect Unwrap")
             layout.operator("uv.unwrap_to_grid", text="Unwrap to Grid")
 
+            # Overlay precision
+            layout.separator()
+            box = layout.box()
+            box.label(text="UV Overlay", icon="UV")
+            box.prop(context.scene, "uv_overlay_quantize")
+            row = box.row()
+            row.enabled = context.scene.uv_overlay_quantize
+            row.prop(context.scene, "uv_overlay_subtexel_steps")
+
             # Info text
             layout.separator()
             box = layout.box()
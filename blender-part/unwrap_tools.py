@@ -8,11 +8,11 @@ import bmesh
 from math import radians, floor, ceil
 from mathutils import Vector, Matrix
 from typing import List, Tuple, Optional, Dict
-from collections import defaultdict
 from itertools import accumulate
 from enum import Enum
 
 from .texture_processor import Vector2Int, RectInt
+from .uv_arrays import get_bmesh_face_islands
 
 
 class Direction(Enum):
@@ -152,57 +152,10 @@ class UnwrapTools:
     @staticmethod
     def get_islands_for_faces(mesh: 'bmesh.types.BMesh', faces: List['bmesh.types.BMFace'], uv_layer) -> List[UVIsland]:
         """Get UV islands for a specific set of faces."""
-        # Build lookups for connected components
-        mesh.faces.ensure_lookup_table()
-        face_to_verts = defaultdict(set)
-        vert_to_faces = defaultdict(set)
-
-        for f in faces:
-            for l in f.loops:
-                id_ = l[uv_layer].uv.to_tuple(5), l.vert.index
-                face_to_verts[f.index].add(id_)
-                vert_to_faces[id_].add(f.index)
-
-        all_face_indices = face_to_verts.keys()
-
-        def connected_faces(face_idx):
-            for vid in face_to_verts[face_idx]:
-                for conn_face_idx in vert_to_faces[vid]:
-                    yield conn_face_idx
-
-        def get_connected_components(nodes, get_connections_for_node):
-            """Get connected components in the graph."""
-            remaining = set(nodes)
-            connected_components = []
-
-            while remaining:
-                node = next(iter(remaining))
-                current_component = []
-                nodes_to_add = [node]
-
-                while nodes_to_add:
-                    node_to_add = nodes_to_add.pop()
-                    if node_to_add in remaining:
-                        remaining.remove(node_to_add)
-                        current_component.append(node_to_add)
-                        nodes_to_add.extend(get_connections_for_node(node_to_add))
-
-                connected_components.append(current_component)
-            return connected_components
-
-        face_idx_islands = get_connected_components(all_face_indices, connected_faces)
-        islands = []
-
-        for face_idx_island in face_idx_islands:
-            islands.append(
-                UVIsland(
-                    [mesh.faces[face_idx] for face_idx in face_idx_island],
-                    mesh,
-                    uv_layer,
-                )
-            )
-
-        return islands
+        return [
+            UVIsland(island, mesh, uv_layer)
+            for island in get_bmesh_face_islands(faces, uv_layer)
+        ]
 
     @staticmethod
     def uv_transform(faces, uv_layer, transformation=Matrix.Identity(3)):
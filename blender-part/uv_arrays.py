@@ -0,0 +1,632 @@
+"""
+Vectorized UV helpers working on flat NumPy arrays.
+Mesh data is read with foreach_get, so no mesh copy or bmesh is needed.
+"""
+
+import hashlib
+from dataclasses import dataclass
+
+import numpy as np
+
+from .polygon_clipping import polygon_areas
+
+
+@dataclass(frozen=True)
+class MeshUvArrays:
+    """Flat per-polygon and per-loop UV data of a mesh."""
+
+    loop_start: np.ndarray  # (polygons,) int32
+    loop_total: np.ndarray  # (polygons,) int32
+    select: np.ndarray  # (polygons,) bool
+    uvs: np.ndarray  # (loops, 2) float32
+    uv_select: np.ndarray  # (loops,) bool
+
+    @property
+    def polygon_count(self) -> int:
+        return len(self.loop_total)
+
+    @property
+    def loop_count(self) -> int:
+        return len(self.uvs)
+
+
+def has_active_uv_layer(obj) -> bool:
+    return bool(
+        obj is not None
+        and hasattr(obj.data, "uv_layers")
+        and hasattr(obj.data.uv_layers, "active")
+        and obj.data.uv_layers.active
+    )
+
+
+def read_mesh_uv_arrays(mesh) -> MeshUvArrays:
+    """Read polygon ranges, selection and active layer UVs of a mesh."""
+    polygon_count = len(mesh.polygons)
+    loop_count = len(mesh.loops)
+    uv_layer = mesh.uv_layers.active
+
+    loop_start = np.empty(polygon_count, dtype=np.int32)
+    loop_total = np.empty(polygon_count, dtype=np.int32)
+    select = np.empty(polygon_count, dtype=bool)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+    mesh.polygons.foreach_get("select", select)
+
+    uvs = np.empty(loop_count * 2, dtype=np.float32)
+    uv_layer.data.foreach_get("uv", uvs)
+
+    uv_select = np.zeros(loop_count, dtype=bool)
+    if hasattr(uv_layer, "vertex_selection"):
+        uv_layer.vertex_selection.foreach_get("value", uv_select)
+
+    return MeshUvArrays(
+        loop_start=loop_start,
+        loop_total=loop_total,
+        select=select,
+        uvs=uvs.reshape(-1, 2),
+        uv_select=uv_select,
+    )
+
+
+def read_bmesh_uv_arrays(bm) -> MeshUvArrays:
+    """
+    read_mesh_uv_arrays() for an edit-mode bmesh. Faces are numbered in
+    iteration order; nothing is written back to the mesh.
+    """
+    faces = bm.faces
+    uv_layer = bm.loops.layers.uv.active
+    loops = [loop for face in faces for loop in face.loops]
+
+    loop_total = np.fromiter(
+        (len(face.loops) for face in faces), dtype=np.int32, count=len(faces)
+    )
+    loop_start = np.zeros(len(faces), dtype=np.int32)
+    np.cumsum(loop_total[:-1], out=loop_start[1:])
+    select = np.fromiter((face.select for face in faces), dtype=bool, count=len(faces))
+
+    uv_data = [loop[uv_layer] for loop in loops]
+    uvs = np.fromiter(
+        (c for data in uv_data for c in data.uv), dtype=np.float32, count=len(loops) * 2
+    )
+    uv_select = np.fromiter(
+        (getattr(data, "select", False) for data in uv_data),
+        dtype=bool,
+        count=len(loops),
+    )
+
+    return MeshUvArrays(
+        loop_start=loop_start,
+        loop_total=loop_total,
+        select=select,
+        uvs=uvs.reshape(-1, 2),
+        uv_select=uv_select,
+    )
+
+
+def fingerprint_uv_arrays(arrays: MeshUvArrays) -> bytes:
+    """Hash the raw bytes of the UV arrays."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(memoryview(arrays.loop_total))
+    digest.update(memoryview(arrays.select))
+    digest.update(memoryview(arrays.uvs))
+    digest.update(memoryview(arrays.uv_select))
+    return digest.digest()
+
+
+def gather_ranges(starts: np.ndarray, lengths: np.ndarray):
+    """
+    Concatenate the index ranges [starts[i], starts[i] + lengths[i]).
+    Returns (offsets, indices) where range i is
+    indices[offsets[i]:offsets[i + 1]].
+    """
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    indices = np.repeat(starts - offsets[:-1], lengths)
+    indices += np.arange(offsets[-1], dtype=np.int64)
+    return offsets, indices
+
+
+def get_face_loop_indices(arrays: MeshUvArrays, polygons: np.ndarray):
+    """Loop indices of the given polygons, see gather_ranges()."""
+    return gather_ranges(arrays.loop_start[polygons], arrays.loop_total[polygons])
+
+
+def get_selected_face_uvs(arrays: MeshUvArrays):
+    """
+    UVs of the selected polygons with V flipped to image space (top-left
+    origin). Returns (polygon_indices, offsets, uvs).
+    """
+    polygons = np.flatnonzero(arrays.select)
+    offsets, loop_indices = get_face_loop_indices(arrays, polygons)
+    uvs = arrays.uvs[loop_indices]
+    uvs[:, 1] = 1.0 - uvs[:, 1]
+    return polygons, offsets, uvs
+
+
+def get_flipped_polygons(arrays: MeshUvArrays) -> np.ndarray:
+    """Mask of polygons whose UVs wind clockwise (negative signed area)."""
+    offsets, loops = get_face_loop_indices(arrays, np.arange(arrays.polygon_count))
+    return polygon_areas(offsets, arrays.uvs[loops]) < 0.0
+
+
+def quantize_uvs(uvs: np.ndarray, grid) -> np.ndarray:
+    """Round UVs to integer steps of a (width, height) grid."""
+    return np.rint(uvs * np.asarray(grid, dtype=np.float64)).astype(np.int32)
+
+
+def gather_faces(polygons, offsets, uvs, indices):
+    """Subset of a (polygons, offsets, uvs) face list."""
+    sub_offsets, loops = gather_ranges(offsets[indices], np.diff(offsets)[indices])
+    return polygons[indices], sub_offsets, uvs[loops]
+
+
+def concat_faces(face_lists):
+    """Join (polygons, offsets, uvs) face lists into one (offsets, uvs)."""
+    offsets = [np.zeros(1, dtype=np.int64)]
+    uvs = []
+    point_count = 0
+    for _, face_offsets, face_uvs in face_lists:
+        offsets.append(face_offsets[1:] + point_count)
+        uvs.append(face_uvs)
+        point_count += len(face_uvs)
+
+    if not uvs:
+        return offsets[0], np.empty((0, 2), dtype=np.float32)
+    return np.concatenate(offsets), np.concatenate(uvs)
+
+
+def diff_faces(old, new):
+    """
+    Compare two (polygons, offsets, uvs) face lists of the same object.
+    Returns (removed_polygons, changed) where changed indexes the faces of
+    new that were added or whose UVs differ.
+    """
+    old_polygons, old_offsets, old_uvs = old
+    new_polygons, new_offsets, new_uvs = new
+
+    removed = np.setdiff1d(old_polygons, new_polygons, assume_unique=True)
+    _, old_idx, new_idx = np.intersect1d(
+        old_polygons, new_polygons, assume_unique=True, return_indices=True
+    )
+
+    old_lengths = np.diff(old_offsets)[old_idx]
+    same_length = old_lengths == np.diff(new_offsets)[new_idx]
+    old_idx = old_idx[same_length]
+    new_idx = new_idx[same_length]
+    lengths = old_lengths[same_length]
+
+    changed = np.ones(len(new_polygons), dtype=bool)
+    if len(lengths):
+        face_offsets, old_loops = gather_ranges(old_offsets[old_idx], lengths)
+        _, new_loops = gather_ranges(new_offsets[new_idx], lengths)
+        loop_changed = np.any(old_uvs[old_loops] != new_uvs[new_loops], axis=1)
+        changed[new_idx] = np.logical_or.reduceat(loop_changed, face_offsets[:-1])
+
+    return removed, np.flatnonzero(changed)
+
+
+def read_loop_vertex_indices(mesh) -> np.ndarray:
+    """Vertex index of every loop of a mesh."""
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    return loop_verts
+
+
+def read_bmesh_loop_vertex_indices(bm) -> np.ndarray:
+    """read_loop_vertex_indices() for a bmesh, in read_bmesh_uv_arrays() order."""
+    bm.verts.index_update()
+    return np.fromiter(
+        (loop.vert.index for face in bm.faces for loop in face.loops), dtype=np.int32
+    )
+
+
+def _sort_uv_keys(loop_verts, uvs, precision: int):
+    """
+    Sort loops by (vertex, UV rounded to precision decimals).
+    Returns (order, linked) where linked[i] tells whether sorted loops i
+    and i + 1 share their key.
+    """
+    scaled = np.rint(np.asarray(uvs, dtype=np.float64).reshape(-1, 2) * 10.0**precision)
+    keys = np.column_stack((np.asarray(loop_verts), scaled.astype(np.int64)))
+    order = np.lexsort(keys.T[::-1])
+    sorted_keys = keys[order]
+    return order, (sorted_keys[1:] == sorted_keys[:-1]).all(axis=1)
+
+
+def weld_uv_vertices(loop_verts, uvs, precision: int = 5):
+    """
+    Merge loops sharing a vertex and UV into UV vertices.
+    Returns (loop_nodes, node_count) with UV vertices numbered in key order.
+    """
+    loop_count = len(loop_verts)
+    if loop_count == 0:
+        return np.empty(0, dtype=np.int64), 0
+    order, linked = _sort_uv_keys(loop_verts, uvs, precision)
+    sorted_nodes = np.zeros(loop_count, dtype=np.int64)
+    np.cumsum(~linked, out=sorted_nodes[1:])
+    loop_nodes = np.empty(loop_count, dtype=np.int64)
+    loop_nodes[order] = sorted_nodes
+    return loop_nodes, int(sorted_nodes[-1]) + 1
+
+
+def label_uv_islands(offsets, loop_verts, uvs, precision: int = 5):
+    """
+    Label the UV islands of a face list. Faces are connected when they
+    share a vertex with the same UV, compared at the given number of
+    decimals. Face i owns loops offsets[i]:offsets[i + 1].
+    Returns (labels, island_count), islands numbered by their first face.
+    """
+    face_count = len(offsets) - 1
+    if face_count <= 0:
+        return np.empty(0, dtype=np.int64), 0
+
+    # Loops sharing a (vertex, rounded UV) key link their faces
+    order, linked = _sort_uv_keys(loop_verts, uvs, precision)
+
+    loop_faces = np.repeat(np.arange(face_count), np.diff(offsets))
+    face_a = loop_faces[order[:-1]][linked]
+    face_b = loop_faces[order[1:]][linked]
+
+    # Union-find with all edges hooked per round: each root is attached
+    # to the smallest root it touches, then paths are fully compressed
+    parent = np.arange(face_count)
+    while True:
+        root_a = parent[face_a]
+        root_b = parent[face_b]
+        pending = root_a != root_b
+        if not pending.any():
+            break
+        face_a = face_a[pending]
+        face_b = face_b[pending]
+        low = np.minimum(root_a[pending], root_b[pending])
+        high = np.maximum(root_a[pending], root_b[pending])
+        np.minimum.at(parent, high, low)
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    roots, labels = np.unique(parent, return_inverse=True)
+    return labels.reshape(-1), len(roots)
+
+
+def get_loop_island_labels(arrays: MeshUvArrays, loop_verts: np.ndarray):
+    """Island index of every loop of a mesh, see label_uv_islands()."""
+    offsets, loops = gather_ranges(arrays.loop_start, arrays.loop_total)
+    labels, _ = label_uv_islands(offsets, loop_verts[loops], arrays.uvs[loops])
+    loop_labels = np.empty(arrays.loop_count, dtype=np.int64)
+    loop_labels[loops] = np.repeat(labels, arrays.loop_total)
+    return loop_labels
+
+
+def get_bmesh_face_islands(faces, uv_layer, precision: int = 5):
+    """Group bmesh faces into UV islands, see label_uv_islands()."""
+    faces = list(faces)
+    offsets = np.zeros(len(faces) + 1, dtype=np.int64)
+    loop_verts = []
+    uvs = []
+    for i, face in enumerate(faces):
+        for loop in face.loops:
+            loop_verts.append(loop.vert.index)
+            uvs.extend(loop[uv_layer].uv)
+        offsets[i + 1] = len(loop_verts)
+
+    labels, island_count = label_uv_islands(
+        offsets, loop_verts, np.reshape(uvs, (-1, 2)), precision
+    )
+    islands = [[] for _ in range(island_count)]
+    for face, label in zip(faces, labels.tolist()):
+        islands[label].append(face)
+    return islands
+
+
+def find_overlapping_boxes(
+    mins, maxs, max_grid_cells: int = 1024, max_box_cells: int = 64
+):
+    """
+    Broad phase over axis-aligned boxes given as (n, 2) min/max corners.
+    Boxes are binned on a uniform grid sized from the median box extent,
+    and only boxes sharing a cell are tested. Boxes spanning more than
+    max_box_cells cells skip the grid and are tested against every box, so
+    a few atlas-sized faces don't multiply the grid entries. Touching boxes
+    count as overlapping. Returns index arrays (first, second) with
+    first < second, sorted by first.
+    """
+    mins = np.asarray(mins, dtype=np.float64).reshape(-1, 2)
+    maxs = np.asarray(maxs, dtype=np.float64).reshape(-1, 2)
+    empty = np.empty(0, dtype=np.int64)
+    if len(mins) < 2:
+        return empty, empty
+
+    origin = mins.min(axis=0)
+    extent = maxs.max(axis=0) - origin
+    cell_size = max(
+        float(np.median((maxs - mins).max(axis=1))),
+        float(extent.max()) / max_grid_cells,
+    )
+    if cell_size <= 0.0:
+        cell_size = 1.0
+
+    cell_min = np.floor((mins - origin) / cell_size).astype(np.int64)
+    cell_max = np.floor((maxs - origin) / cell_size).astype(np.int64)
+    spans = cell_max - cell_min + 1
+    cell_counts = spans[:, 0] * spans[:, 1]
+    large = cell_counts > max_box_cells
+    small = np.flatnonzero(~large)
+
+    # One entry per (small box, covered cell)
+    _, entry_ids = gather_ranges(
+        np.zeros(len(small), dtype=np.int64), cell_counts[small]
+    )
+    boxes = np.repeat(small, cell_counts[small])
+    cells_x = cell_min[boxes, 0] + entry_ids % spans[boxes, 0]
+    cells_y = cell_min[boxes, 1] + entry_ids // spans[boxes, 0]
+    cell_keys = cells_x * (int(cell_max[:, 1].max()) + 1) + cells_y
+
+    order = np.argsort(cell_keys, kind="stable")
+    cell_keys = cell_keys[order]
+    boxes = boxes[order]
+    cells_x = cells_x[order]
+    cells_y = cells_y[order]
+
+    # Pair every entry with the entries after it in the same cell
+    group_starts = np.flatnonzero(np.r_[True, cell_keys[1:] != cell_keys[:-1]])
+    group_ends = np.r_[group_starts[1:], len(cell_keys)]
+    entry_group_ends = np.repeat(group_ends, np.diff(np.r_[group_starts, len(cell_keys)]))
+    partner_counts = entry_group_ends - np.arange(len(cell_keys)) - 1
+    _, partners = gather_ranges(np.arange(1, len(cell_keys) + 1), partner_counts)
+    entries = np.repeat(np.arange(len(cell_keys)), partner_counts)
+
+    first = boxes[entries]
+    second = boxes[partners]
+
+    # Report each pair once, from the cell holding the corner of the overlap
+    corner = np.maximum(mins[first], mins[second])
+    corner_cells = np.floor((corner - origin) / cell_size).astype(np.int64)
+    keep = (corner_cells[:, 0] == cells_x[entries]) & (
+        corner_cells[:, 1] == cells_y[entries]
+    )
+    keep &= ~(
+        (maxs[first] < mins[second]).any(axis=1)
+        | (maxs[second] < mins[first]).any(axis=1)
+    )
+    firsts = [first[keep]]
+    seconds = [second[keep]]
+
+    # Large boxes against all small boxes and the large boxes after them,
+    # in chunks bounding the (chunk, n) comparison matrix
+    chunk = max(1, (1 << 22) // len(mins))
+    indices = np.arange(len(mins))
+    large_boxes = np.flatnonzero(large)
+    for start in range(0, len(large_boxes), chunk):
+        rows = large_boxes[start : start + chunk]
+        hits = ~(
+            (maxs[rows, None] < mins[None]).any(axis=2)
+            | (maxs[None] < mins[rows, None]).any(axis=2)
+        )
+        hits &= ~large[None] | (indices[None] > rows[:, None])
+        row_ids, partner_ids = np.nonzero(hits)
+        firsts.append(rows[row_ids])
+        seconds.append(partner_ids)
+
+    first = np.concatenate(firsts)
+    second = np.concatenate(seconds)
+    swap = first > second
+    first[swap], second[swap] = second[swap], first[swap]
+    order = np.lexsort((second, first))
+    return first[order], second[order]
+
+
+def rasterize_face_texels(offsets, uvs, size, rows=None, max_rows: int = 1 << 16):
+    """
+    Texels of a (width, height) image covered by each face, a texel being
+    covered when its center lies inside the face's UV polygon (even-odd
+    rule). Texels outside the image, or outside the (start, end) range of
+    rows, are ignored. Faces are scanned row by row: the edge crossings of
+    a row give its covered spans, so no per-texel candidates are built.
+    At most max_rows (face, row) pairs are scanned at a time.
+    Returns int32 (faces, texels) with texels as flat row-major indices.
+    """
+    width, height = size
+    row_start, row_end = (0, height) if rows is None else rows
+    offsets = np.asarray(offsets, dtype=np.int64)
+    points = np.asarray(uvs, dtype=np.float64).reshape(-1, 2) * (width, height)
+    lengths = np.diff(offsets)
+
+    all_faces = []
+    all_texels = []
+    # Faces of the same vertex count are scanned together
+    for length in np.unique(lengths):
+        if length < 3:
+            continue
+        faces = np.flatnonzero(lengths == length)
+        _, loops = gather_ranges(offsets[faces], np.full(len(faces), length))
+        polygons = points[loops].reshape(len(faces), length, 2)
+        next_points = np.roll(polygons, -1, axis=1)
+
+        # Rows whose texel centers lie within each face's V range
+        first_row = np.maximum(np.ceil(polygons[..., 1].min(axis=1) - 0.5), row_start)
+        last_row = np.minimum(np.floor(polygons[..., 1].max(axis=1) - 0.5), row_end - 1)
+        row_counts = np.maximum(last_row - first_row + 1, 0).astype(np.int64)
+        first_row = first_row.astype(np.int64)
+        row_offsets = np.zeros(len(faces) + 1, dtype=np.int64)
+        np.cumsum(row_counts, out=row_offsets[1:])
+
+        for chunk_start in range(0, int(row_offsets[-1]), max_rows):
+            row_ids = np.arange(chunk_start, min(chunk_start + max_rows, row_offsets[-1]))
+            row_faces = np.searchsorted(row_offsets, row_ids, side="right") - 1
+            y = first_row[row_faces] + row_ids - row_offsets[row_faces]
+            center_y = (y + 0.5)[:, None]
+
+            start = polygons[row_faces]
+            end = next_points[row_faces]
+            crosses = (start[..., 1] > center_y) != (end[..., 1] > center_y)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                hit_x = start[..., 0] + (center_y - start[..., 1]) * (
+                    end[..., 0] - start[..., 0]
+                ) / (end[..., 1] - start[..., 1])
+            hit_x = np.where(crosses, hit_x, np.inf)
+            hit_x.sort(axis=1)
+
+            # Centers from crossing 2k up to crossing 2k + 1 are inside
+            pairs = length // 2
+            span_first = np.ceil(hit_x[:, 0 : 2 * pairs : 2] - 0.5)
+            span_last = np.ceil(hit_x[:, 1 : 2 * pairs : 2] - 0.5)
+            span_first = np.clip(span_first, 0, width).astype(np.int64)
+            span_last = np.clip(span_last, 0, width).astype(np.int64)
+            span_lengths = np.maximum(span_last - span_first, 0).reshape(-1)
+            span_starts = (y[:, None] * width + span_first).reshape(-1)
+
+            _, texels = gather_ranges(span_starts, span_lengths)
+            span_faces = np.repeat(faces[row_faces], pairs)
+            all_faces.append(np.repeat(span_faces, span_lengths).astype(np.int32))
+            all_texels.append(texels.astype(np.int32))
+
+    if not all_faces:
+        empty = np.empty(0, dtype=np.int32)
+        return empty, empty
+    return np.concatenate(all_faces), np.concatenate(all_texels)
+
+
+def find_texel_overlaps(offsets, uvs, size, max_band_texels: int = 1 << 18):
+    """
+    Rasterize faces onto a (width, height) texel grid and find faces
+    covering the same texels. The grid is processed in bands of rows
+    holding at most max_band_texels texels.
+    Returns a dict with "coverage" (faces per texel) and "owner" (first
+    face per texel, -1 if none) as (height, width) arrays, the number of
+    "conflict_texels", and "pairs" as (first, second, texel_counts) arrays
+    of overlapping face pairs with first < second.
+    """
+    width, height = size
+    face_count = max(len(offsets) - 1, 1)
+    coverage = np.zeros(width * height, dtype=np.int32)
+    owner = np.full(width * height, face_count, dtype=np.int32)
+    band_keys = []
+    band_counts = []
+
+    band_rows = max(1, max_band_texels // max(width, 1))
+    for row_start in range(0, height, band_rows):
+        rows = (row_start, min(row_start + band_rows, height))
+        faces, texels = rasterize_face_texels(offsets, uvs, size, rows)
+        band = slice(rows[0] * width, rows[1] * width)
+        coverage[band] += np.bincount(
+            texels - band.start, minlength=band.stop - band.start
+        ).astype(np.int32)
+        np.minimum.at(owner, texels, faces)
+
+        # Pair up all faces sharing a texel, skipping texels with one face
+        shared = coverage[texels] > 1
+        faces = faces[shared].astype(np.int64)
+        texels = texels[shared]
+        order = np.lexsort((faces, texels))
+        faces = faces[order]
+        texels = texels[order]
+        group_starts = np.flatnonzero(np.r_[True, texels[1:] != texels[:-1]])
+        group_ends = np.repeat(
+            np.r_[group_starts[1:], len(texels)],
+            np.diff(np.r_[group_starts, len(texels)]),
+        )
+        partner_counts = group_ends - np.arange(len(texels)) - 1
+        _, partners = gather_ranges(np.arange(1, len(texels) + 1), partner_counts)
+        first = np.repeat(faces, partner_counts)
+        second = faces[partners]
+
+        # A face covers each texel once, so every pair holds two distinct faces
+        keys, counts = np.unique(first * face_count + second, return_counts=True)
+        band_keys.append(keys)
+        band_counts.append(counts)
+
+    owner[owner == face_count] = -1
+    if band_keys:
+        pair_keys, inverse = np.unique(np.concatenate(band_keys), return_inverse=True)
+        texel_counts = np.bincount(inverse, weights=np.concatenate(band_counts))
+        texel_counts = texel_counts.astype(np.int64)
+    else:
+        pair_keys = texel_counts = np.empty(0, dtype=np.int64)
+
+    return {
+        "coverage": coverage.reshape(height, width),
+        "owner": owner.reshape(height, width),
+        "conflict_texels": int(np.count_nonzero(coverage > 1)),
+        "pairs": (pair_keys // face_count, pair_keys % face_count, texel_counts),
+    }
+
+
+@dataclass(frozen=True)
+class UvGraph:
+    """
+    UV vertices (loops welded by vertex and UV) and their edges, with
+    adjacency and member loops stored as CSR arrays.
+    """
+
+    loop_nodes: np.ndarray  # (loops,) UV vertex of each loop
+    loop_offsets: np.ndarray  # (nodes + 1,) rows into node_loops
+    node_loops: np.ndarray  # loops grouped by UV vertex
+    offsets: np.ndarray  # (nodes + 1,) rows into neighbors
+    neighbors: np.ndarray  # adjacent UV vertices, sorted per node
+
+    @property
+    def node_count(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.neighbors) // 2
+
+    def degree(self, node: int) -> int:
+        return int(self.offsets[node + 1] - self.offsets[node])
+
+    def connected_nodes(self, node: int) -> np.ndarray:
+        return self.neighbors[self.offsets[node] : self.offsets[node + 1]]
+
+    def get_loops(self, node: int) -> np.ndarray:
+        return self.node_loops[self.loop_offsets[node] : self.loop_offsets[node + 1]]
+
+
+def _to_csr(rows, columns, row_count: int):
+    """CSR rows of (row, column) pairs, keeping the column order per row."""
+    order = np.argsort(rows, kind="stable")
+    offsets = np.zeros(row_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=row_count), out=offsets[1:])
+    return offsets, columns[order]
+
+
+def build_uv_graph(loop_verts, uvs, next_loops, precision: int = 5) -> UvGraph:
+    """
+    Graph of UV vertices connected along face edges. next_loops gives the
+    position of each loop's successor in its face, or -1 when it is not
+    part of the input.
+    """
+    loop_nodes, node_count = weld_uv_vertices(loop_verts, uvs, precision)
+    next_loops = np.asarray(next_loops, dtype=np.int64)
+
+    # Each face edge links a loop's UV vertex to its successor's
+    has_next = next_loops >= 0
+    starts = loop_nodes[has_next]
+    ends = loop_nodes[next_loops[has_next]]
+    proper = starts != ends
+    edge_keys = np.sort(
+        np.concatenate(
+            (
+                starts[proper] * node_count + ends[proper],
+                ends[proper] * node_count + starts[proper],
+            )
+        )
+    )
+    edge_keys = edge_keys[np.r_[True, edge_keys[1:] != edge_keys[:-1]][: len(edge_keys)]]
+    offsets, neighbors = _to_csr(
+        edge_keys // max(node_count, 1), edge_keys % max(node_count, 1), node_count
+    )
+    loop_offsets, node_loops = _to_csr(
+        loop_nodes, np.arange(len(loop_nodes)), node_count
+    )
+
+    return UvGraph(
+        loop_nodes=loop_nodes,
+        loop_offsets=loop_offsets,
+        node_loops=node_loops,
+        offsets=offsets,
+        neighbors=neighbors,
+    )
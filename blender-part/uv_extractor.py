@@ -6,18 +6,38 @@ __status__ = "production"
 __version__ = "6.6"
 __date__ = "22 Apr 2022"
 
+import hashlib
 import os
 import traceback
-from collections import defaultdict
 from itertools import islice
 from math import fabs, sqrt
 from pprint import pprint
-from time import time
 
 import bmesh
 import bpy
+import numpy as np
 from mathutils import Vector
 
+from .image_manager import ImageManager
+from .polygon_clipping import intersect_polygons, polygon_areas
+from .uv_arrays import (
+    build_uv_graph,
+    concat_faces,
+    find_overlapping_boxes,
+    find_texel_overlaps,
+    fingerprint_uv_arrays,
+    get_bmesh_face_islands,
+    get_face_loop_indices,
+    get_flipped_polygons,
+    get_selected_face_uvs,
+    has_active_uv_layer,
+    quantize_uvs,
+    read_bmesh_loop_vertex_indices,
+    read_bmesh_uv_arrays,
+    read_loop_vertex_indices,
+    read_mesh_uv_arrays,
+)
+
 __DEBUG_MODE = False
 
 
@@ -183,67 +203,17 @@ def get_all_space_types():
         }
 
 
-class Node:
-    def __init__(self, key, value=None):
-        self.key = key
-        self.value = value
-        self.edges = []
-
-    def degree(self):
-        return len(self.edges)
-
-    def connected_nodes(self):
-        return [e.other(self) for e in self.edges]
-
-
-class Edge:
-    def __init__(self, node_1, node_2):
-        self.node_1 = node_1
-        self.node_2 = node_2
-
-    def other(self, node):
-        if self.node_1 == node and self.node_2 == node:
-            raise RuntimeError("Loop edge in {} is not supported.".format(node.key))
-        if node not in (self.node_1, self.node_2):
-            raise RuntimeError("Node {} does not belong this edge.".format(node.key))
-        if self.node_1 == node:
-            return self.node_2
-        return self.node_1
-
-
-class Graph:
-    def __init__(self):
-        self.edges = []
-        self.nodes = {}
-
-    def add_node(self, node):
-        if node.key in self.nodes:
-            raise RuntimeError("Node '{}' is already registered.".format(node.key))
-        self.nodes[node.key] = node
-
-    def add_edge(self, node_1, node_2):
-        if node_1.key not in self.nodes:
-            raise RuntimeError("Node '{}' is not registered.".format(node_1.key))
-        if node_2.key not in self.nodes:
-            raise RuntimeError("Node '{}' is not registered.".format(node_2.key))
-
-        edge = Edge(node_1, node_2)
-        self.edges.append(edge)
-        node_1.edges.append(edge)
-        node_2.edges.append(edge)
-
-    def get_node(self, key):
-        return self.nodes[key]
-
-
 def dump_graph(graph):
+    """Print the UV vertices and edges of a uv_arrays.UvGraph."""
     print("=== Node ===")
-    for _, node in graph.nodes.items():
-        print("Key: {}, Value {}".format(node.key, node.value))
+    for node in range(graph.node_count):
+        print("Key: {}, Loops {}".format(node, graph.get_loops(node).tolist()))
 
     print("=== Edge ===")
-    for edge in graph.edges:
-        print("{} - {}".format(edge.node_1.key, edge.node_2.key))
+    for node in range(graph.node_count):
+        for other in graph.connected_nodes(node).tolist():
+            if node < other:
+                print("{} - {}".format(node, other))
 
 
 # VF2 algorithm
@@ -252,15 +222,20 @@ def dump_graph(graph):
 #   Ref: https://github.com/satemochi/saaaaah/blob/master/geometric_misc/
 #            isomorph/vf2/vf2.py
 def graph_is_isomorphic(graph_1, graph_2):
+    """
+    Match the nodes of two uv_arrays.UvGraph instances. Returns
+    (is_isomorphic, {node of graph_1: node of graph_2}).
+    """
+
     def is_iso(pairs, matching_node, new_node):
         # Algorithm:
         #   1. The degree is same (It's faster).
         #   2. The connected node is same.
-        if matching_node.degree() != new_node.degree():
+        if graph_1.degree(matching_node) != graph_2.degree(new_node):
             return False
 
-        matching_connected = [c.key for c in matching_node.connected_nodes()]
-        new_connected = [c.key for c in new_node.connected_nodes()]
+        matching_connected = set(graph_1.connected_nodes(matching_node).tolist())
+        new_connected = set(graph_2.connected_nodes(new_node).tolist())
 
         for p in pairs:
             n1 = p[0]
@@ -277,8 +252,8 @@ def graph_is_isomorphic(graph_1, graph_2):
             remove_1 = [p[0] for p in pairs]
             remove_2 = [p[1] for p in pairs]
 
-            keys_1 = sorted(list(set(g1.nodes.keys()) - set(remove_1)))
-            keys_2 = sorted(list(set(g2.nodes.keys()) - set(remove_2)))
+            keys_1 = sorted(set(range(g1.node_count)) - set(remove_1))
+            keys_2 = sorted(set(range(g2.node_count)) - set(remove_2))
             for k1 in keys_1:
                 for k2 in keys_2:
                     yield (k1, k2)
@@ -288,12 +263,10 @@ def graph_is_isomorphic(graph_1, graph_2):
         while stack:
             try:
                 k1, k2 = next(stack[-1])
-                n1 = graph_1.get_node(k1)
-                n2 = graph_2.get_node(k2)
-                if is_iso(pairs, n1, n2):
+                if is_iso(pairs, k1, k2):
                     pairs.append([k1, k2])
                     stack.append(generate_pair(graph_1, graph_2, pairs))
-                    if len(pairs) == len(graph_1.nodes):
+                    if len(pairs) == graph_1.node_count:
                         return True, pairs
             except StopIteration:
                 stack.pop()
@@ -304,20 +277,14 @@ def graph_is_isomorphic(graph_1, graph_2):
         return False, []
 
     # First, check simple condition.
-    if len(graph_1.nodes) != len(graph_2.nodes):
+    if graph_1.node_count != graph_2.node_count:
         return False, {}
-    if len(graph_1.edges) != len(graph_2.edges):
+    if graph_1.edge_count != graph_2.edge_count:
         return False, {}
 
     is_isomorphic, pairs = dfs(graph_1, graph_2)
 
-    node_pairs = {}
-    for pair in pairs:
-        n1 = pair[0]
-        n2 = pair[1]
-        node_1 = graph_1.get_node(n1)
-        node_2 = graph_2.get_node(n2)
-        node_pairs[node_1] = node_2
+    node_pairs = {n1: n2 for n1, n2 in pairs}
 
     return is_isomorphic, node_pairs
 
@@ -538,54 +505,6 @@ def __get_island_info(uv_layer, islands):
     return island_info
 
 
-def __parse_island(bm, face_idx, faces_left, island, face_to_verts, vert_to_faces):
-    """
-    Parse island
-    """
-
-    faces_to_parse = [face_idx]
-    while faces_to_parse:
-        fidx = faces_to_parse.pop(0)
-        if fidx in faces_left:
-            faces_left.remove(fidx)
-            island.append({"face": bm.faces[fidx]})
-            for v in face_to_verts[fidx]:
-                connected_faces = vert_to_faces[v]
-                for cf in connected_faces:
-                    faces_to_parse.append(cf)
-
-
-def __get_island(bm, face_to_verts, vert_to_faces):
-    """
-    Get island list
-    """
-
-    uv_island_lists = []
-    faces_left = set(face_to_verts.keys())
-    while faces_left:
-        current_island = []
-        face_idx = list(faces_left)[0]
-        __parse_island(
-            bm, face_idx, faces_left, current_island, face_to_verts, vert_to_faces
-        )
-        uv_island_lists.append(current_island)
-
-    return uv_island_lists
-
-
-def __create_vert_face_db(faces, uv_layer):
-    # create mesh database for all faces
-    face_to_verts = defaultdict(set)
-    vert_to_faces = defaultdict(set)
-    for f in faces:
-        for l in f.loops:
-            id_ = l[uv_layer].uv.to_tuple(5), l.vert.index
-            face_to_verts[f.index].add(id_)
-            vert_to_faces[id_].add(f.index)
-
-    return (face_to_verts, vert_to_faces)
-
-
 def get_island_info(obj, only_selected=True):
     bm = bmesh.from_edit_mesh(obj.data)
     if check_version(2, 73, 0) >= 0:
@@ -633,10 +552,12 @@ def get_island_info_from_bmesh(bm, only_selected=True):
 
 
 def get_island_info_from_faces(bm, faces, uv_layer):
-    ftv, vtf = __create_vert_face_db(faces, uv_layer)
+    uv_island_lists = [
+        [{"face": face} for face in island]
+        for island in get_bmesh_face_islands(faces, uv_layer)
+    ]
 
     # Get island information
-    uv_island_lists = __get_island(bm, ftv, vtf)
     island_info = __get_island_info(uv_layer, uv_island_lists)
 
     return island_info
@@ -1226,346 +1147,6 @@ def get_loop_sequences(bm, uv_layer, closed=False):
     return loop_seqs, ""
 
 
-def __is_segment_intersect(start1, end1, start2, end2):
-    seg1 = end1 - start1
-    seg2 = end2 - start2
-
-    a1 = -seg1.y
-    b1 = seg1.x
-    d1 = -(a1 * start1.x + b1 * start1.y)
-
-    a2 = -seg2.y
-    b2 = seg2.x
-    d2 = -(a2 * start2.x + b2 * start2.y)
-
-    seg1_line2_start = a2 * start1.x + b2 * start1.y + d2
-    seg1_line2_end = a2 * end1.x + b2 * end1.y + d2
-
-    seg2_line1_start = a1 * start2.x + b1 * start2.y + d1
-    seg2_line1_end = a1 * end2.x + b1 * end2.y + d1
-
-    if (seg1_line2_start * seg1_line2_end >= 0) or (
-        seg2_line1_start * seg2_line1_end >= 0
-    ):
-        return False, None
-
-    u = seg1_line2_start / (seg1_line2_start - seg1_line2_end)
-    out = start1 + u * seg1
-
-    return True, out
-
-
-class RingBuffer:
-    def __init__(self, arr):
-        self.__buffer = arr.copy()
-        self.__pointer = 0
-
-    def __repr__(self):
-        return repr(self.__buffer)
-
-    def __len__(self):
-        return len(self.__buffer)
-
-    def insert(self, val, offset=0):
-        self.__buffer.insert(self.__pointer + offset, val)
-
-    def head(self):
-        return self.__buffer[0]
-
-    def tail(self):
-        return self.__buffer[-1]
-
-    def get(self, offset=0):
-        size = len(self.__buffer)
-        val = self.__buffer[(self.__pointer + offset) % size]
-        return val
-
-    def next(self):
-        size = len(self.__buffer)
-        self.__pointer = (self.__pointer + 1) % size
-
-    def reset(self):
-        self.__pointer = 0
-
-    def find(self, obj):
-        try:
-            idx = self.__buffer.index(obj)
-        except ValueError:
-            return None
-        return self.__buffer[idx]
-
-    def find_and_next(self, obj):
-        size = len(self.__buffer)
-        idx = self.__buffer.index(obj)
-        self.__pointer = (idx + 1) % size
-
-    def find_and_set(self, obj):
-        idx = self.__buffer.index(obj)
-        self.__pointer = idx
-
-    def as_list(self):
-        return self.__buffer.copy()
-
-    def reverse(self):
-        self.__buffer.reverse()
-        self.reset()
-
-
-# clip: reference polygon
-# subject: tested polygon
-def __do_weiler_atherton_cliping(clip_uvs, subject_uvs, mode, same_polygon_threshold):
-    clip_uvs = RingBuffer(clip_uvs)
-    if __is_polygon_flipped(clip_uvs):
-        clip_uvs.reverse()
-    subject_uvs = RingBuffer(subject_uvs)
-    if __is_polygon_flipped(subject_uvs):
-        subject_uvs.reverse()
-
-    debug_print("===== Clip UV List =====")
-    debug_print(clip_uvs)
-    debug_print("===== Subject UV List =====")
-    debug_print(subject_uvs)
-
-    # check if clip and subject is overlapped completely
-    if __is_polygon_same(clip_uvs, subject_uvs, same_polygon_threshold):
-        polygons = [subject_uvs.as_list()]
-        debug_print("===== Polygons Overlapped Completely =====")
-        debug_print(polygons)
-        return True, polygons
-
-    # check if subject is in clip
-    if __is_points_in_polygon(subject_uvs, clip_uvs):
-        polygons = [subject_uvs.as_list()]
-        return True, polygons
-
-    # check if clip is in subject
-    if __is_points_in_polygon(clip_uvs, subject_uvs):
-        polygons = [subject_uvs.as_list()]
-        return True, polygons
-
-    # check if clip and subject is overlapped partially
-    intersections = []
-    while True:
-        subject_uvs.reset()
-        while True:
-            uv_start1 = clip_uvs.get()
-            uv_end1 = clip_uvs.get(1)
-            uv_start2 = subject_uvs.get()
-            uv_end2 = subject_uvs.get(1)
-            intersected, point = __is_segment_intersect(
-                uv_start1, uv_end1, uv_start2, uv_end2
-            )
-            if intersected:
-                clip_uvs.insert(point, 1)
-                subject_uvs.insert(point, 1)
-                intersections.append([point, [clip_uvs.get(), clip_uvs.get(1)]])
-            subject_uvs.next()
-            if subject_uvs.get() == subject_uvs.head():
-                break
-        clip_uvs.next()
-        if clip_uvs.get() == clip_uvs.head():
-            break
-
-    debug_print("===== Intersection List =====")
-    debug_print(intersections)
-
-    # no intersection, so subject and clip is not overlapped
-    if not intersections:
-        return False, None
-
-    def get_intersection_pair(intersects, key):
-        for sect in intersects:
-            if sect[0] == key:
-                return sect[1]
-
-        return None
-
-    # make enter/exit pair
-    subject_uvs.reset()
-    subject_entering = []
-    subject_exiting = []
-    clip_entering = []
-    clip_exiting = []
-    intersect_uv_list = []
-    while True:
-        pair = get_intersection_pair(intersections, subject_uvs.get())
-        if pair:
-            sub = subject_uvs.get(1) - subject_uvs.get(-1)
-            inter = pair[1] - pair[0]
-            cross = sub.x * inter.y - inter.x * sub.y
-            if cross < 0:
-                subject_entering.append(subject_uvs.get())
-                clip_exiting.append(subject_uvs.get())
-            else:
-                subject_exiting.append(subject_uvs.get())
-                clip_entering.append(subject_uvs.get())
-            intersect_uv_list.append(subject_uvs.get())
-
-        subject_uvs.next()
-        if subject_uvs.get() == subject_uvs.head():
-            break
-
-    debug_print("===== Enter List =====")
-    debug_print(clip_entering)
-    debug_print(subject_entering)
-    debug_print("===== Exit List =====")
-    debug_print(clip_exiting)
-    debug_print(subject_exiting)
-
-    # for now, can't handle the situation when fulfill all below conditions
-    #        * two faces have common edge
-    #        * each face is intersected
-    #        * Show Mode is "Part"
-    #       so for now, ignore this situation
-    if len(subject_entering) != len(subject_exiting):
-        if mode == "FACE":
-            polygons = [subject_uvs.as_list()]
-            return True, polygons
-        return False, None
-
-    def traverse(current_list, entering, exiting, p, current, other_list):
-        result = current_list.find(current)
-        if not result:
-            return None
-        if result != current:
-            print("Internal Error")
-            return None
-        if not exiting:
-            print("Internal Error: No exiting UV")
-            return None
-
-        # enter
-        if entering.count(current) >= 1:
-            entering.remove(current)
-
-        current_list.find_and_next(current)
-        current = current_list.get()
-
-        prev = None
-        error = False
-        while exiting.count(current) == 0:
-            p.append(current.copy())
-            current_list.find_and_next(current)
-            current = current_list.get()
-            if prev == current:
-                error = True
-                break
-            prev = current
-
-        if error:
-            print("Internal Error: Infinite loop")
-            return None
-
-        # exit
-        p.append(current.copy())
-        exiting.remove(current)
-
-        other_list.find_and_set(current)
-        return other_list.get()
-
-    # Traverse
-    polygons = []
-    current_uv_list = subject_uvs
-    other_uv_list = clip_uvs
-    current_entering = subject_entering
-    current_exiting = subject_exiting
-
-    poly = []
-    current_uv = current_entering[0]
-
-    while True:
-        current_uv = traverse(
-            current_uv_list,
-            current_entering,
-            current_exiting,
-            poly,
-            current_uv,
-            other_uv_list,
-        )
-
-        if current_uv is None:
-            break
-
-        if current_uv_list == subject_uvs:
-            current_uv_list = clip_uvs
-            other_uv_list = subject_uvs
-            current_entering = clip_entering
-            current_exiting = clip_exiting
-            debug_print("-- Next: Clip --")
-        else:
-            current_uv_list = subject_uvs
-            other_uv_list = clip_uvs
-            current_entering = subject_entering
-            current_exiting = subject_exiting
-            debug_print("-- Next: Subject --")
-
-        debug_print(clip_entering)
-        debug_print(clip_exiting)
-        debug_print(subject_entering)
-        debug_print(subject_exiting)
-
-        if (
-            not clip_entering
-            and not clip_exiting
-            and not subject_entering
-            and not subject_exiting
-        ):
-            break
-
-    polygons.append(poly)
-
-    debug_print("===== Polygons Overlapped Partially =====")
-    debug_print(polygons)
-
-    return True, polygons
-
-
-def __is_polygon_flipped(points):
-    area = 0.0
-    for i in range(len(points)):
-        uv1 = points.get(i)
-        uv2 = points.get(i + 1)
-        a = uv1.x * uv2.y - uv1.y * uv2.x
-        area = area + a
-    if area < 0:
-        # clock-wise
-        return True
-    return False
-
-
-def __is_point_in_polygon(point, subject_points):
-    """Return true when point is inside of the polygon by using
-    'Crossing number algorithm'.
-    """
-
-    count = 0
-    for i in range(len(subject_points)):
-        uv_start1 = subject_points.get(i)
-        uv_end1 = subject_points.get(i + 1)
-        uv_start2 = point
-        uv_end2 = Vector((1000000.0, point.y))
-
-        # If the point exactly matches to the point of the polygon,
-        # this point is not in polygon.
-        if uv_start1.x == uv_start2.x and uv_start1.y == uv_start2.y:
-            return False
-
-        intersected, _ = __is_segment_intersect(uv_start1, uv_end1, uv_start2, uv_end2)
-        if intersected:
-            count = count + 1
-
-    return count % 2
-
-
-def __is_points_in_polygon(points, subject_points):
-    for i in range(len(points)):
-        internal = __is_point_in_polygon(points.get(i), subject_points)
-        if not internal:
-            return False
-
-    return True
-
-
 def get_uv_editable_objects(context):
     if check_version(2, 80, 0) < 0:
         objs = []
@@ -1585,207 +1166,174 @@ def get_uv_editable_objects(context):
 def get_overlapped_uv_info(
     bm_list, faces_list, uv_layer_list, mode, same_polygon_threshold=0.0000001
 ):
-    # at first, check island overlapped
-    isl = []
-    for bm, uv_layer, faces in zip(bm_list, uv_layer_list, faces_list):
-        info = get_island_info_from_faces(bm, faces, uv_layer)
-        isl.extend([(i, uv_layer, bm) for i in info])
-
-    overlapped_isl_pairs = []
-    overlapped_uv_layer_pairs = []
-    overlapped_bm_paris = []
-    for i, (i1, uv_layer_1, bm_1) in enumerate(isl):
-        for i2, uv_layer_2, bm_2 in isl[i + 1 :]:
-            if (
-                (i1["max"].x < i2["min"].x)
-                or (i2["max"].x < i1["min"].x)
-                or (i1["max"].y < i2["min"].y)
-                or (i2["max"].y < i1["min"].y)
-            ):
-                continue
-            overlapped_isl_pairs.append([i1, i2])
-            overlapped_uv_layer_pairs.append([uv_layer_1, uv_layer_2])
-            overlapped_bm_paris.append([bm_1, bm_2])
+    # collect the faces of all islands with their UV bounding boxes
+    faces = []
+    for bm, uv_layer, bm_faces in zip(bm_list, uv_layer_list, faces_list):
+        info = get_island_info_from_faces(bm, bm_faces, uv_layer)
+        for isl in info:
+            faces.extend((face, uv_layer, bm) for face in isl["faces"])
+
+    if len(faces) < 2:
+        return []
+
+    # fast operation, only faces with overlapping bounding boxes are candidates
+    mins = np.array([(f["min_uv"].x, f["min_uv"].y) for f, _, _ in faces])
+    maxs = np.array([(f["max_uv"].x, f["max_uv"].y) for f, _, _ in faces])
+    clip_indices, subject_indices = find_overlapping_boxes(mins, maxs)
+
+    face_uvs = [None] * len(faces)
+
+    def get_face_uvs(index):
+        if face_uvs[index] is None:
+            face, uv_layer, _ = faces[index]
+            face_uvs[index] = [l[uv_layer].uv.copy() for l in face["face"].loops]
+        return face_uvs[index]
 
-    # check polygon overlapped (inter UV islands)
     overlapped_uvs = []
-    for oip, uvlp, bmp in zip(
-        overlapped_isl_pairs, overlapped_uv_layer_pairs, overlapped_bm_paris
+    for clip_index, subject_index in zip(
+        clip_indices.tolist(), subject_indices.tolist()
     ):
-        for clip in oip[0]["faces"]:
-            f_clip = clip["face"]
-            clip_uvs = [l[uvlp[0]].uv.copy() for l in f_clip.loops]
-            for subject in oip[1]["faces"]:
-                f_subject = subject["face"]
-
-                # fast operation, apply bounding box algorithm
-                if (
-                    (clip["max_uv"].x < subject["min_uv"].x)
-                    or (subject["max_uv"].x < clip["min_uv"].x)
-                    or (clip["max_uv"].y < subject["min_uv"].y)
-                    or (subject["max_uv"].y < clip["min_uv"].y)
-                ):
-                    continue
+        clip, clip_uv_layer, clip_bm = faces[clip_index]
+        subject, subject_uv_layer, subject_bm = faces[subject_index]
+        clip_uvs = get_face_uvs(clip_index)
+        subject_uvs = get_face_uvs(subject_index)
+
+        # slow operation, clip the two faces
+        pieces, area = intersect_polygons(clip_uvs, subject_uvs, same_polygon_threshold)
+        if pieces:
+            if mode == "FACE":
+                polygons = [subject_uvs]
+            else:
+                polygons = [[Vector(p) for p in piece] for piece in pieces]
+            overlapped_uvs.append(
+                {
+                    "clip_bmesh": clip_bm,
+                    "subject_bmesh": subject_bm,
+                    "clip_face": clip["face"],
+                    "subject_face": subject["face"],
+                    "clip_uv_layer": clip_uv_layer,
+                    "subject_uv_layer": subject_uv_layer,
+                    "subject_uvs": subject_uvs,
+                    "polygons": polygons,
+                    "area": area,
+                }
+            )
 
-                subject_uvs = [l[uvlp[1]].uv.copy() for l in f_subject.loops]
-                # slow operation, apply Weiler-Atherton cliping algorithm
-                result, polygons = __do_weiler_atherton_cliping(
-                    clip_uvs, subject_uvs, mode, same_polygon_threshold
-                )
-                if result:
-                    overlapped_uvs.append(
-                        {
-                            "clip_bmesh": bmp[0],
-                            "subject_bmesh": bmp[1],
-                            "clip_face": f_clip,
-                            "subject_face": f_subject,
-                            "clip_uv_layer": uvlp[0],
-                            "subject_uv_layer": uvlp[1],
-                            "subject_uvs": subject_uvs,
-                            "polygons": polygons,
-                        }
-                    )
+    return overlapped_uvs
 
-    # check polygon overlapped (intra UV island)
-    for info, uv_layer, bm in isl:
-        for i in range(len(info["faces"])):
-            clip = info["faces"][i]
-            f_clip = clip["face"]
-            clip_uvs = [l[uv_layer].uv.copy() for l in f_clip.loops]
-            for j in range(len(info["faces"])):
-                if j <= i:
-                    continue
 
-                subject = info["faces"][j]
-                f_subject = subject["face"]
+def get_texel_overlapped_uv_info(objects, image_size=None, only_selected=False):
+    """
+    Faces covering the same texels of the synced image, a cheaper check
+    than clipping that matches what is visible in Pixelorama.
+    Returns a list of {"clip_object", "subject_object", "clip_polygon",
+    "subject_polygon", "texels"} dicts.
+    """
+    if image_size is None and ImageManager.INSTANCE:
+        try:
+            image_size = ImageManager.INSTANCE.get_image_size()
+        except KeyError:
+            # The synced image was renamed or removed
+            return []
+    if not image_size or not image_size[0] or not image_size[1]:
+        return []
 
-                # fast operation, apply bounding box algorithm
-                if (
-                    (clip["max_uv"].x < subject["min_uv"].x)
-                    or (subject["max_uv"].x < clip["min_uv"].x)
-                    or (clip["max_uv"].y < subject["min_uv"].y)
-                    or (subject["max_uv"].y < clip["min_uv"].y)
-                ):
-                    continue
+    mesh_objects = []
+    face_lists = []
+    for obj in objects:
+        if obj.type != "MESH" or not has_active_uv_layer(obj):
+            continue
+        arrays = uv_object_cache.get_entry(obj)["arrays"]
+        if only_selected:
+            polygons = np.flatnonzero(arrays.select)
+        else:
+            polygons = np.arange(arrays.polygon_count)
+        offsets, loops = get_face_loop_indices(arrays, polygons)
+        mesh_objects.append(obj)
+        face_lists.append((polygons, offsets, arrays.uvs[loops]))
 
-                subject_uvs = [l[uv_layer].uv.copy() for l in f_subject.loops]
-                # slow operation, apply Weiler-Atherton cliping algorithm
-                result, polygons = __do_weiler_atherton_cliping(
-                    clip_uvs, subject_uvs, mode, same_polygon_threshold
-                )
-                if result:
-                    overlapped_uvs.append(
-                        {
-                            "clip_bmesh": bm,
-                            "subject_bmesh": bm,
-                            "clip_face": f_clip,
-                            "subject_face": f_subject,
-                            "clip_uv_layer": uv_layer,
-                            "subject_uv_layer": uv_layer,
-                            "subject_uvs": subject_uvs,
-                            "polygons": polygons,
-                        }
-                    )
+    if not face_lists:
+        return []
 
-    return overlapped_uvs
+    offsets, uvs = concat_faces(face_lists)
+    face_objects = np.repeat(
+        np.arange(len(face_lists)), [len(polygons) for polygons, _, _ in face_lists]
+    )
+    face_polygons = np.concatenate([polygons for polygons, _, _ in face_lists])
+
+    overlaps = find_texel_overlaps(offsets, uvs, tuple(image_size))
+    first, second, texel_counts = overlaps["pairs"]
+    return [
+        {
+            "clip_object": mesh_objects[face_objects[clip]],
+            "subject_object": mesh_objects[face_objects[subject]],
+            "clip_polygon": int(face_polygons[clip]),
+            "subject_polygon": int(face_polygons[subject]),
+            "texels": int(texels),
+        }
+        for clip, subject, texels in zip(
+            first.tolist(), second.tolist(), texel_counts.tolist()
+        )
+    ]
 
 
 def get_flipped_uv_info(bm_list, faces_list, uv_layer_list):
-    flipped_uvs = []
+    # signed areas of all faces at once, clock-wise faces are flipped
+    entries = []
+    offsets = [0]
+    uvs = []
     for bm, faces, uv_layer in zip(bm_list, faces_list, uv_layer_list):
         for f in faces:
-            polygon = RingBuffer([l[uv_layer].uv.copy() for l in f.loops])
-            if __is_polygon_flipped(polygon):
-                uvs = [l[uv_layer].uv.copy() for l in f.loops]
-                flipped_uvs.append(
-                    {
-                        "bmesh": bm,
-                        "face": f,
-                        "uv_layer": uv_layer,
-                        "uvs": uvs,
-                        "polygons": [polygon.as_list()],
-                    }
-                )
-
-    return flipped_uvs
-
+            face_uvs = [l[uv_layer].uv.copy() for l in f.loops]
+            entries.append((bm, f, uv_layer, face_uvs))
+            uvs.extend(face_uvs)
+            offsets.append(len(uvs))
 
-def __is_polygon_same(points1, points2, threshold):
-    if len(points1) != len(points2):
-        return False
-
-    pts1 = points1.as_list()
-    pts2 = points2.as_list()
+    if not entries:
+        return []
 
-    for p1 in pts1:
-        for p2 in pts2:
-            diff = p2 - p1
-            if diff.length < threshold:
-                pts2.remove(p2)
-                break
-        else:
-            return False
+    flipped = polygon_areas(offsets, np.array(uvs, dtype=np.float64)) < 0.0
+    flipped_uvs = []
+    for (bm, f, uv_layer, face_uvs), is_flipped in zip(entries, flipped.tolist()):
+        if is_flipped:
+            flipped_uvs.append(
+                {
+                    "bmesh": bm,
+                    "face": f,
+                    "uv_layer": uv_layer,
+                    "uvs": face_uvs,
+                    "polygons": [face_uvs],
+                }
+            )
 
-    return True
+    return flipped_uvs
 
 
-def _is_uv_loop_connected(l1, l2, uv_layer):
-    uv1 = l1[uv_layer].uv
-    uv2 = l2[uv_layer].uv
-    return uv1.x == uv2.x and uv1.y == uv2.y
+def get_flipped_polygon_masks(objects):
+    """
+    Mask of flipped polygons per object name, computed from the cached
+    foreach_get UV arrays - cheap enough to run on every UV change.
+    """
+    masks = {}
+    for obj in objects:
+        if obj.type != "MESH" or not has_active_uv_layer(obj):
+            continue
+        masks[obj.name] = get_flipped_polygons(uv_object_cache.get_entry(obj)["arrays"])
+    return masks
 
 
 def create_uv_graph(loops, uv_layer):
-    # For looking up faster.
-    loop_index_to_loop = {}  # { loop index: loop }
-    for l in loops:
-        loop_index_to_loop[l.index] = l
-
-    # Setup relationship between uv_vert and loops.
-    # uv_vert is a representative of the loops which shares same
-    # UV coordinate.
-    uv_vert_to_loops = {}  # { uv_vert: loops belonged to uv_vert }
-    loop_to_uv_vert = {}  # { loop: uv_vert belonged to }
-    for l in loops:
-        found = False
-        for k in uv_vert_to_loops.keys():
-            if _is_uv_loop_connected(k, l, uv_layer):
-                uv_vert_to_loops[k].append(l)
-                loop_to_uv_vert[l] = k
-                found = True
-                break
-        if not found:
-            uv_vert_to_loops[l] = [l]
-            loop_to_uv_vert[l] = l
-
-    # Collect adjacent uv_vert.
-    uv_adj_verts = {}  # { uv_vert: adj uv_vert list }
-    for v, vs in uv_vert_to_loops.items():
-        uv_adj_verts[v] = []
-        for ll in vs:
-            ln = ll.link_loop_next
-            lp = ll.link_loop_prev
-            uv_adj_verts[v].append(loop_to_uv_vert[ln])
-            uv_adj_verts[v].append(loop_to_uv_vert[lp])
-        uv_adj_verts[v] = list(set(uv_adj_verts[v]))
-
-    # Setup uv_vert graph.
-    graph = Graph()
-    for v in uv_adj_verts.keys():
-        graph.add_node(Node(v.index, {"uv_vert": v, "loops": uv_vert_to_loops[v]}))
-    edges = []
-    for v, adjs in uv_adj_verts.items():
-        n1 = graph.get_node(v.index)
-        for a in adjs:
-            n2 = graph.get_node(a.index)
-            edges.append(tuple(sorted((n1.key, n2.key))))
-    edges = list(set(edges))
-    for e in edges:
-        n1 = graph.get_node(e[0])
-        n2 = graph.get_node(e[1])
-        graph.add_edge(n1, n2)
-
-    return graph
+    """
+    Graph of UV vertices - loops sharing a vertex and UV coordinate -
+    connected along face edges, see uv_arrays.UvGraph.
+    Node loops are positions into the given loops.
+    """
+    loops = list(loops)
+    position = {l: i for i, l in enumerate(loops)}
+    loop_verts = [l.vert.index for l in loops]
+    uvs = np.array([l[uv_layer].uv.to_tuple() for l in loops], dtype=np.float64)
+    next_loops = [position.get(l.link_loop_next, -1) for l in loops]
+    return build_uv_graph(loop_verts, uvs.reshape(-1, 2), next_loops)
 
 
 def getUvData():
@@ -1835,134 +1383,165 @@ def getUvData():
     return list
 
 
-def getUvOverlay():
-    selected_objects = set(bpy.context.view_layer.objects.selected)
-    selected_objects.add(bpy.context.view_layer.objects.active)
-    list = []
-    for obj in selected_objects:
-        data = getUvFromObject(obj)
-        for d in data:
-            list.append(d)
-    return list
+def _uv_faces_to_lists(offsets, uvs):
+    uvs = uvs.tolist()
+    offsets = offsets.tolist()
+    return [uvs[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
 
 
-def getUvFromObject(selected_object):
-    # selected_object = bpy.context.view_layer.objects.active
-    mode = selected_object.mode
+def getUvOverlay(grid=None):
+    offsets, uvs = get_uv_overlay_arrays(grid)
+    return _uv_faces_to_lists(offsets, uvs)
 
-    if not (
-        hasattr(selected_object.data, "uv_layers")
-        and hasattr(selected_object.data.uv_layers, "active")
-        and selected_object.data.uv_layers.active
-    ):
-        print("does not have UV data.")
-        return []
 
-    print(mode)
-    bm = None
-    data_copy = selected_object.data.copy()
-    bm = bmesh.new()
-    bm.from_mesh(data_copy)
+def get_uv_overlay_by_object(grid=None):
+    """Overlay faces as {object name: (polygons, offsets, uvs)}"""
+    overlays = {}
+    for obj in get_overlay_objects():
+        overlay = uv_object_cache.get_overlay(obj, grid)
+        if overlay is not None:
+            overlays[obj.name] = overlay
+    return overlays
 
-    bm.verts.ensure_lookup_table()
-    bm.edges.ensure_lookup_table()
-    bm.faces.ensure_lookup_table()
-    # pprint(bm.faces)
-    data = get_island_info_from_bmesh(bm, True)
-    list = []
-    uv_layer = bm.loops.layers.uv.active
 
-    for d in data:
-        fcs = d["faces"]
-        for f in fcs:
-            loops = []
-            for u in f["face"].loops:
-                loop = [u[uv_layer].uv[0], 1 - u[uv_layer].uv[1]]
-                loops.append(loop)
-            list.append(loops)
-    return list
+def get_uv_overlay_arrays(grid=None):
+    """
+    Overlay faces of all overlay objects as (offsets, uvs) where face i
+    owns uvs[offsets[i]:offsets[i + 1]].
+    """
+    return concat_faces(get_uv_overlay_by_object(grid).values())
+
+
+def getUvFromObject(selected_object):
+    overlay = uv_object_cache.get_overlay(selected_object)
+    if overlay is None:
+        return []
+    _, offsets, uvs = overlay
+    return _uv_faces_to_lists(offsets, uvs)
 
 
 # code here is taken or heavily inspired from pribambase made by lampysprites
 
 
-def get_fast_hash():
-    raw_str = ""
-    selected_objects = set(bpy.context.view_layer.objects.selected)
-    if bpy.context.view_layer.objects.active is not None:
-        selected_objects.add(bpy.context.view_layer.objects.active)
-
-    print(f"DEBUG: Selected objects: {[o.name for o in selected_objects]}")
-    print(
-        f"DEBUG: Active object: {bpy.context.view_layer.objects.active.name if bpy.context.view_layer.objects.active else None}"
-    )
+def get_overlay_objects():
+    """Selected objects plus the active one, sorted by name"""
+    view_layer = bpy.context.view_layer
+    objects = set(view_layer.objects.selected)
+    if view_layer.objects.active is not None:
+        objects.add(view_layer.objects.active)
+    return sorted(objects, key=lambda o: o.name)
 
-    t = time()
-    for o in selected_objects:
-        raw_str += o.name
-        mode = o.mode
-        print(f"DEBUG: Object '{o.name}' mode: {mode}")
-
-        if not (
-            hasattr(o.data, "uv_layers")
-            and hasattr(o.data.uv_layers, "active")
-            and o.data.uv_layers.active
-        ):
-            print("DEBUG: does not have UV data.")
-            continue
 
-        bm = None
-        data_copy = o.data.copy()
-        bm = bmesh.new()
-        try:
-            bm.from_mesh(data_copy)
+def read_object_uv_arrays(obj):
+    """
+    UV arrays of an object. In Edit Mode they are read from the edit bmesh,
+    without update_from_editmode(): writing back would tag the object and
+    trigger another depsgraph update.
+    """
+    if obj.mode == "EDIT":
+        return read_bmesh_uv_arrays(bmesh.from_edit_mesh(obj.data))
+    return read_mesh_uv_arrays(obj.data)
 
-            bm.verts.ensure_lookup_table()
-            bm.edges.ensure_lookup_table()
-            bm.faces.ensure_lookup_table()
 
-            if not bm.loops.layers.uv:
-                print(f"DEBUG: No UV layers on object '{o.name}'")
-                continue
-            uv_layer = bm.loops.layers.uv.verify()
+def read_object_loop_vertex_indices(obj):
+    """Loop vertex indices matching read_object_uv_arrays()."""
+    if obj.mode == "EDIT":
+        return read_bmesh_loop_vertex_indices(bmesh.from_edit_mesh(obj.data))
+    return read_loop_vertex_indices(obj.data)
 
-            # Get all faces (regardless of selection state) for debugging
-            all_faces = list(bm.faces)
-            selected_faces = [f for f in bm.faces if f.select]
 
-            print(
-                f"DEBUG: Object '{o.name}' - Total faces: {len(all_faces)}, Selected faces: {len(selected_faces)}"
-            )
+class UvObjectCache:
+    """
+    Per-object UV fingerprints and overlay payloads.
+    Entries are only rebuilt after the object was invalidated or its
+    mesh, mode or active UV layer changed.
+    """
+
+    def __init__(self):
+        self.entries = {}
+
+    @staticmethod
+    def make_key(obj):
+        return (
+            obj.name,
+            obj.data.as_pointer(),
+            obj.mode,
+            obj.data.uv_layers.active.name,
+        )
+
+    def invalidate(self, names=None):
+        if names is None:
+            self.entries.clear()
+            return
+        for name in names:
+            self.entries.pop(name, None)
+
+    def invalidate_meshes(self, pointers):
+        """Drop the entries of every object using one of these meshes."""
+        for name, entry in list(self.entries.items()):
+            if entry["key"][1] in pointers:
+                del self.entries[name]
+
+    def retain(self, names):
+        for name in set(self.entries) - set(names):
+            del self.entries[name]
+
+    def get_entry(self, obj):
+        key = self.make_key(obj)
+        entry = self.entries.get(obj.name)
+        if entry is None or entry["key"] != key:
+            arrays = read_object_uv_arrays(obj)
+            entry = {
+                "key": key,
+                "arrays": arrays,
+                "fingerprint": fingerprint_uv_arrays(arrays),
+                "overlay": None,
+                "overlay_grid": None,
+            }
+            self.entries[obj.name] = entry
+        return entry
+
+    def get_fingerprint(self, obj):
+        return self.get_entry(obj)["fingerprint"]
+
+    def get_overlay(self, obj, grid=None):
+        """
+        Return (polygon_indices, offsets, uvs) of the selected faces.
+        With a (width, height) grid the UVs are quantized to integer steps.
+        """
+        if not has_active_uv_layer(obj):
+            return None
+        entry = self.get_entry(obj)
+        if entry["overlay"] is None or entry["overlay_grid"] != grid:
+            polygons, offsets, uvs = get_selected_face_uvs(entry["arrays"])
+            if grid is not None:
+                uvs = quantize_uvs(uvs, grid)
+            # Overlays are shared with the encoder thread, keep them immutable
+            for array in (polygons, offsets, uvs):
+                array.setflags(write=False)
+            entry["overlay"] = (polygons, offsets, uvs)
+            entry["overlay_grid"] = grid
+        return entry["overlay"]
 
-            # For more stable hashing, use all face information instead of just selected faces
-            face_data = []
-            for i, f in enumerate(all_faces):
-                face_uvs = []
-                for u in f.loops:
-                    uv = u[uv_layer].uv
-                    # Use higher precision and more variation
-                    face_uvs.extend([round(uv[0], 6), round(uv[1], 6)])
-
-                # Include face index and selection state
-                face_data.append((i, f.select, tuple(face_uvs)))
-
-            raw_str += str(mode)  # Add mode
-            raw_str += str(len(all_faces))  # Total face count
-            raw_str += str(len(selected_faces))  # Selected face count
-            raw_str += str(tuple(face_data))  # UV data of all faces
-
-            print(
-                f"DEBUG: Added data for '{o.name}': mode={mode}, total_faces={len(all_faces)}, selected_faces={len(selected_faces)}"
-            )
 
+uv_object_cache = UvObjectCache()
+
+
+def get_fast_hash():
+    objects = get_overlay_objects()
+    # Objects leaving the selection are not tracked for changes anymore
+    uv_object_cache.retain(o.name for o in objects)
+
+    digest = hashlib.blake2b(digest_size=16)
+    for o in objects:
+        digest.update(o.name.encode())
+        digest.update(o.mode.encode())
+        if not has_active_uv_layer(o):
+            continue
+        try:
+            digest.update(uv_object_cache.get_fingerprint(o))
         except Exception as e:
-            print(f"DEBUG: Error processing object '{o.name}': {e}")
-            print(e, "\n", traceback.print_exc())
-            print(e)
-        finally:
-            bm.free()
-            bpy.data.meshes.remove(data_copy)
-
-    result_hash = hash(raw_str)
-    print(f"DEBUG: Final raw string length: {len(raw_str)}, Hash: {result_hash}")
-    return result_hash
+            print(f"Error fingerprinting object '{o.name}': {e}")
+            traceback.print_exc()
+
+    return digest.hexdigest()
@@ -1,54 +1,299 @@
-from time import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 import bpy
+import numpy as np
+from bpy.app.handlers import persistent
 
 from .image_manager import ImageManager
 from .server import get_server_status, send_message
-from .uv_extractor import get_fast_hash, getUvOverlay
+from .uv_arrays import concat_faces, diff_faces, gather_faces
+from .uv_extractor import get_fast_hash, get_uv_overlay_by_object, uv_object_cache
+from .wire_format import pack_uv_overlay
+
+
+class UvOverlayStream:
+    """Encode overlays as sequenced keyframes and per-face deltas"""
+
+    keyframe_interval = 60
+
+    def __init__(self) -> None:
+        self.sequence = 0
+        self.sent = {}
+        self.frames_since_keyframe = 0
+        self.force_keyframe = True
+        self.grid = None
+        # Clients that lost track of the stream and wait for a keyframe
+        self.keyframe_clients = set()
+        self.lock = threading.Lock()
+
+    def request_keyframe(self, client=None):
+        """Send a keyframe to one client, or make the next frame a keyframe"""
+        with self.lock:
+            if client is None:
+                self.force_keyframe = True
+            else:
+                self.keyframe_clients.add(client)
+
+    def take_keyframe_clients(self):
+        with self.lock:
+            clients, self.keyframe_clients = self.keyframe_clients, set()
+        return clients
+
+    def encode(self, overlays, grid=None):
+        """
+        Encode {object name: (polygons, offsets, uvs)} against the last sent
+        overlay. Returns None when no face changed.
+        """
+        keyframe = (
+            self.force_keyframe
+            or grid != self.grid
+            or self.frames_since_keyframe >= self.keyframe_interval
+        )
+        frame = self._pack(overlays, grid, keyframe, self.sequence)
+        if frame is None:
+            return None
+
+        self.sequence = (self.sequence + 1) & 0xFFFFFFFF
+        self.sent = overlays
+        self.grid = grid
+        if keyframe:
+            with self.lock:
+                self.force_keyframe = False
+                self.keyframe_clients.clear()
+            self.frames_since_keyframe = 0
+        else:
+            self.frames_since_keyframe += 1
+        return frame
+
+    def encode_keyframe(self):
+        """
+        Keyframe of the last sent overlay under its sequence number, so a
+        client receiving it picks up the following deltas.
+        """
+        last_sequence = (self.sequence - 1) & 0xFFFFFFFF
+        return self._pack(self.sent, self.grid, True, last_sequence)
+
+    def _pack(self, overlays, grid, keyframe, sequence):
+        names = sorted(overlays if keyframe else overlays.keys() | self.sent.keys())
+        removed_objects, removed_polygons = [], []
+        face_objects, face_lists = [], []
+        for index, name in enumerate(names):
+            new = overlays.get(name)
+            old = None if keyframe else self.sent.get(name)
+            if old is None:
+                removed, faces = None, new
+            elif new is None:
+                removed, faces = old[0], None
+            else:
+                removed, changed = diff_faces(old, new)
+                faces = gather_faces(*new, changed)
+
+            if removed is not None and len(removed):
+                removed_objects.append(np.full(len(removed), index, dtype=np.int32))
+                removed_polygons.append(removed)
+            if faces is not None and len(faces[0]):
+                face_objects.append(np.full(len(faces[0]), index, dtype=np.int32))
+                face_lists.append(faces)
+
+        if not keyframe and not removed_polygons and not face_lists:
+            return None
+
+        offsets, uvs = concat_faces(face_lists)
+        return pack_uv_overlay(
+            sequence=sequence,
+            keyframe=keyframe,
+            object_names=names,
+            removed_objects=_concat(removed_objects),
+            removed_polygons=_concat(removed_polygons),
+            face_objects=_concat(face_objects),
+            face_polygons=_concat([faces[0] for faces in face_lists]),
+            offsets=offsets,
+            uvs=uvs,
+            grid=grid,
+        )
+
+
+def get_overlay_grid(scene):
+    """
+    Quantization grid for overlay UVs: the synced image size in
+    1 / uv_overlay_subtexel_steps texel units, or None for float UVs.
+    """
+    if not scene.uv_overlay_quantize or not ImageManager.INSTANCE:
+        return None
+    try:
+        size = ImageManager.INSTANCE.get_image_size()
+    except KeyError:
+        return None
+    if not size or not size[0] or not size[1]:
+        return None
+    steps = scene.uv_overlay_subtexel_steps
+    return (size[0] * steps, size[1] * steps)
+
+
+def _concat(arrays):
+    if not arrays:
+        return np.empty(0, dtype=np.int32)
+    return np.concatenate(arrays)
 
 
 class UvWatch:
+    """Push UV overlays to clients when the depsgraph reports a change"""
+
     last_hash = None
     instance = None
+    interval = 0.5
 
     def __init__(self) -> None:
+        self.needs_sync = True
+        self.selection = frozenset()
+        self.stream = UvOverlayStream()
+        # Single worker: frames must be encoded and sent in order
+        self.encoder = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="uv-overlay-encoder"
+        )
+        # Timers are matched by callable identity and every attribute access
+        # creates a new bound method, so keep the registered ones around
+        self.flush_timer = self.flush
+        self.check_timer = self.check_for_changes
+        self._ignore_updates = 0
+        self.stopped = False
         UvWatch.instance = self
 
-    def check_for_changes(self):
-        interval = 0.5
-        t = time()
+    def stop(self):
+        """Shut the encoder down; unregister the timers and handler first"""
+        self.stopped = True
+        self.encoder.shutdown(wait=False, cancel_futures=True)
+
+    @contextmanager
+    def ignore_own_updates(self):
+        """Drop depsgraph updates tagged by the add-on inside this block"""
+        self._ignore_updates += 1
         try:
-            ImageManager.UPDATING_IMAGE.acquire()
-            print(
-                f"hello, perfcheck{time() - t}",
-            )
-            new_hash = get_fast_hash()
-            print(f"hello, perfcheck{time() - t}")
-            print("hashing func", new_hash, self.last_hash)
-            # Get server status
-            status = get_server_status()
-            print(new_hash, self.last_hash)
-            print("hash:", new_hash != self.last_hash)
-            if (
-                new_hash != self.last_hash
-                and status["running"]
-                and status["clients_count"] > 0
-            ):
-                dd = getUvOverlay()
-                print("uv data changed, sending overlay")
-                send_message(
-                    {
-                        "type": "GET_UV_OVERLAY",
-                        "data": dd,
-                        "noshow": True,
-                        "requestId": -1,
-                    }
-                )
-                self.last_hash = new_hash
+            yield
         finally:
-            ImageManager.UPDATING_IMAGE.release()
-            print(interval)
-            return interval
+            # Evaluate now, so updates tagged inside reach the handler while
+            # they are still ignored
+            bpy.context.evaluated_depsgraph_get()
+            self._ignore_updates -= 1
+
+    def on_depsgraph_update(self, scene, depsgraph):
+        if self._ignore_updates or self.stopped:
+            return
+
+        view_layer = depsgraph.view_layer
+        selection = {o.name for o in view_layer.objects.selected}
+        if view_layer.objects.active is not None:
+            selection.add(view_layer.objects.active.name)
+        selection = frozenset(selection)
+
+        # Selection-only changes are not flagged as geometry updates, so any
+        # update of a watched object or its mesh marks it dirty
+        changed = set()
+        edited_objects = set()
+        edited_meshes = set()
+        for update in depsgraph.updates:
+            # Shading-only updates come from material and image changes,
+            # e.g. our own texture syncs, and never touch UVs
+            if update.is_updated_shading and not update.is_updated_geometry:
+                continue
+            if isinstance(update.id, bpy.types.Object):
+                if update.id.type == "MESH":
+                    edited_objects.add(update.id.name)
+                    if update.id.name in selection:
+                        changed.add(update.id.name)
+            elif isinstance(update.id, bpy.types.Mesh):
+                edited_meshes.add(update.id.original.as_pointer())
+                # Mesh datablock updates don't say which object uses them
+                for name in selection:
+                    obj = view_layer.objects.get(name)
+                    if obj and obj.data and obj.data.name == update.id.name:
+                        changed.add(name)
+
+        # Invalidate here rather than in sync(), which only runs with a
+        # client connected; validation and overlap checks share the cache
+        uv_object_cache.invalidate(edited_objects)
+        uv_object_cache.invalidate_meshes(edited_meshes)
+
+        if selection != self.selection:
+            self.selection = selection
+            self.needs_sync = True
+        if changed:
+            self.needs_sync = True
+
+        # Build the overlay in a one-shot timer so that several depsgraph
+        # updates in the same frame end up in a single broadcast
+        if self.needs_sync and not bpy.app.timers.is_registered(self.flush_timer):
+            bpy.app.timers.register(self.flush_timer, first_interval=0.0)
+
+    def request_sync(self, client=None):
+        """
+        Send a keyframe on the next timer tick, to one client (its
+        client_info) or to all of them. Safe from any thread.
+        """
+        self.last_hash = None
+        self.stream.request_keyframe(client)
+        self.needs_sync = True
+
+    def flush(self):
+        self.sync()
+        return None
+
+    def check_for_changes(self):
+        # Fallback for sync requests raised outside the depsgraph handler,
+        # e.g. a client connecting; idle ticks only read a flag.
+        if self.needs_sync:
+            self.sync()
+        return self.interval
+
+    def sync(self):
+        if self.stopped:
+            # A timer outlived unregister(); the encoder no longer accepts work
+            return
+
+        status = get_server_status()
+        if not (status["running"] and status["clients_count"] > 0):
+            # Keep the dirty state so the first client gets a fresh overlay
+            return
+
+        # Deliver edits tagged since the last evaluation before reading
+        bpy.context.evaluated_depsgraph_get()
+
+        with ImageManager.UPDATING_IMAGE, self.ignore_own_updates():
+            self.needs_sync = False
+            new_hash = get_fast_hash()
+            if new_hash == self.last_hash:
+                return
+
+            # Only the foreach_get reads happen here; the cached arrays are
+            # read-only snapshots, so diffing and packing run off the main
+            # thread
+            grid = get_overlay_grid(bpy.context.scene)
+            overlays = get_uv_overlay_by_object(grid)
+            future = self.encoder.submit(self.encode_and_send, overlays, grid)
+            future.add_done_callback(_report_encoder_error)
+            self.last_hash = new_hash
+
+    def encode_and_send(self, overlays, grid):
+        frame = self.stream.encode(overlays, grid)
+        if frame is not None:
+            print("uv data changed, sending overlay")
+            # Frames are sequenced, so a client missing one resyncs
+            send_message(frame, broadcast=True)
+
+        # Clients that lost track get a keyframe of their own; the others
+        # keep receiving deltas
+        clients = self.stream.take_keyframe_clients()
+        if clients:
+            keyframe = self.stream.encode_keyframe()
+            for client in clients:
+                send_message(keyframe, broadcast=True, client=client)
+
+
+def _report_encoder_error(future):
+    if not future.cancelled() and future.exception():
+        print(f"Error encoding UV overlay: {future.exception()}")
 
 
 class ImagesStateWatch:
@@ -110,3 +355,9 @@ class ImagesStateWatch:
                 }
             )
         return 0.5
+
+
+@persistent
+def uv_depsgraph_update_handler(scene, depsgraph):
+    if UvWatch.instance:
+        UvWatch.instance.on_depsgraph_update(scene, depsgraph)
@@ -0,0 +1,175 @@
+"""
+Binary WebSocket frames exchanged with the Pixelorama extension.
+All values are little-endian; each frame starts with a 4 byte magic.
+"""
+
+import struct
+from dataclasses import dataclass
+
+import numpy as np
+
+# UV overlay frame:
+#   header            magic, version, flags, object count, sequence,
+#                     face count, point count, grid width, grid height
+#   object names      per object: uint16 byte length + UTF-8 name,
+#                     zero padded to a multiple of 4 bytes
+#   removed count     uint32
+#   removed faces     int32[removed count] object index,
+#                     int32[removed count] polygon index
+#   faces             int32[face count] object index,
+#                     int32[face count] polygon index
+#   offsets           int32[face count + 1], face i owns
+#                     points[offsets[i]:offsets[i + 1]]
+#   points            Godot Variant encoded PackedVector2Array of (u, v)
+#                     float32 pairs, decoded with a single bytes_to_var();
+#                     quantized frames hold integer grid steps (x, y)
+#                     instead, where u = x / grid width and
+#                     v = y / grid height. float32 keeps them exact up to
+#                     2^24 steps
+#
+# A keyframe replaces the whole overlay; other frames are deltas that remove
+# and upsert faces by (object, polygon index). Sequence numbers increase by
+# one per frame so clients can detect a lost delta and ask for a keyframe.
+UV_FRAME_MAGIC = b"BLUV"
+UV_FRAME_VERSION = 4
+UV_FRAME_HEADER = struct.Struct("<4sBBHIIIII")
+UV_FRAME_KEYFRAME = 0x01
+UV_FRAME_QUANTIZED = 0x02
+
+GODOT_TYPE_PACKED_VECTOR2_ARRAY = 35
+GODOT_VARIANT_ARRAY_HEADER = struct.Struct("<II")
+
+
+def _pack_names(names) -> bytes:
+    parts = []
+    for name in names:
+        encoded = name.encode("utf-8")
+        parts.append(struct.pack("<H", len(encoded)))
+        parts.append(encoded)
+    table = b"".join(parts)
+    return table + b"\0" * (-len(table) % 4)
+
+
+def _int32_bytes(values) -> bytes:
+    return np.ascontiguousarray(values, dtype="<i4").tobytes()
+
+
+def pack_uv_overlay(
+    sequence,
+    keyframe,
+    object_names,
+    removed_objects,
+    removed_polygons,
+    face_objects,
+    face_polygons,
+    offsets,
+    uvs,
+    grid=None,
+) -> bytes:
+    face_count = len(offsets) - 1
+    point_count = len(uvs)
+    flags = UV_FRAME_KEYFRAME if keyframe else 0
+    if grid is None:
+        grid = (0, 0)
+    else:
+        flags |= UV_FRAME_QUANTIZED
+    points = b"".join(
+        (
+            GODOT_VARIANT_ARRAY_HEADER.pack(
+                GODOT_TYPE_PACKED_VECTOR2_ARRAY, point_count
+            ),
+            np.ascontiguousarray(uvs, dtype="<f4").tobytes(),
+        )
+    )
+    return b"".join(
+        (
+            UV_FRAME_HEADER.pack(
+                UV_FRAME_MAGIC,
+                UV_FRAME_VERSION,
+                flags,
+                len(object_names),
+                sequence,
+                face_count,
+                point_count,
+                grid[0],
+                grid[1],
+            ),
+            _pack_names(object_names),
+            struct.pack("<I", len(removed_objects)),
+            _int32_bytes(removed_objects),
+            _int32_bytes(removed_polygons),
+            _int32_bytes(face_objects),
+            _int32_bytes(face_polygons),
+            _int32_bytes(offsets),
+            points,
+        )
+    )
+
+
+# Texture frame (Pixelorama -> Blender):
+#   header    magic, version, flags, name byte length, width, height,
+#             row stride in bytes
+#   name      UTF-8 image name, zero padded to a multiple of 4 bytes
+#   pixels    height rows of RGBA8 pixels, top row first
+# With TEXTURE_FRAME_DIRTY_RECTS the pixels are replaced by:
+#   rect count    uint32
+#   rects         per rect: uint32 x, y, width, height (top-left origin),
+#                 followed by height rows of width RGBA8 pixels
+TEXTURE_FRAME_MAGIC = b"BLTX"
+TEXTURE_FRAME_VERSION = 1
+TEXTURE_FRAME_HEADER = struct.Struct("<4sBBHIII")
+TEXTURE_FRAME_DIRTY_RECTS = 0x01
+TEXTURE_RECT_HEADER = struct.Struct("<IIII")
+
+
+@dataclass
+class TextureFrame:
+    """
+    Decoded texture frame. patches holds (x, y, pixels) tuples in Blender's
+    bottom-up pixel space, pixels being (height, width, 4) uint8 arrays.
+    A full frame has a single patch covering the whole image.
+    """
+
+    image_name: str
+    width: int
+    height: int
+    full: bool
+    patches: list
+
+
+def _read_rows(data, pos, width, height, stride):
+    rows = np.frombuffer(data, dtype=np.uint8, count=height * stride, offset=pos)
+    pixels = rows.reshape(height, stride)[:, : width * 4].reshape(height, width, 4)
+    # Godot rows run top to bottom, Blender's bottom to top
+    return pixels[::-1]
+
+
+def unpack_texture_frame(data: bytes) -> TextureFrame:
+    magic, version, flags, name_length, width, height, stride = (
+        TEXTURE_FRAME_HEADER.unpack_from(data)
+    )
+    if magic != TEXTURE_FRAME_MAGIC or version != TEXTURE_FRAME_VERSION:
+        raise ValueError(f"Unsupported texture frame {magic!r} v{version}")
+    if stride < width * 4:
+        raise ValueError(f"Row stride {stride} too small for width {width}")
+
+    pos = TEXTURE_FRAME_HEADER.size
+    name = bytes(data[pos : pos + name_length]).decode("utf-8")
+    pos += name_length + (-name_length % 4)
+
+    if not flags & TEXTURE_FRAME_DIRTY_RECTS:
+        pixels = _read_rows(data, pos, width, height, stride)
+        return TextureFrame(name, width, height, True, [(0, 0, pixels)])
+
+    (rect_count,) = struct.unpack_from("<I", data, pos)
+    pos += 4
+    patches = []
+    for _ in range(rect_count):
+        x, y, rect_width, rect_height = TEXTURE_RECT_HEADER.unpack_from(data, pos)
+        pos += TEXTURE_RECT_HEADER.size
+        if x + rect_width > width or y + rect_height > height:
+            raise ValueError(f"Dirty rect {x},{y} {rect_width}x{rect_height} out of bounds")
+        pixels = _read_rows(data, pos, rect_width, rect_height, rect_width * 4)
+        pos += rect_height * rect_width * 4
+        patches.append((x, height - y - rect_height, pixels))
+    return TextureFrame(name, width, height, False, patches)
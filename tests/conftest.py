@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Pure modules of the add-on are imported directly, without bpy
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "blender-part"))
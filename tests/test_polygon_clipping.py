@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from polygon_clipping import intersect_polygons, polygon_areas
+
+UNIT_SQUARE = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+# Unit square without its top right quarter
+L_SHAPE = [(0.0, 0.0), (1.0, 0.0), (1.0, 0.5), (0.5, 0.5), (0.5, 1.0), (0.0, 1.0)]
+
+
+def test_partial_overlap():
+    shifted = [(x + 0.5, y + 0.5) for x, y in UNIT_SQUARE]
+    pieces, area = intersect_polygons(UNIT_SQUARE, shifted)
+    assert area == pytest.approx(0.25)
+    assert len(pieces) == 1
+
+
+def test_winding_is_ignored():
+    shifted = [(x + 0.5, y + 0.5) for x, y in UNIT_SQUARE]
+    _, area = intersect_polygons(UNIT_SQUARE[::-1], shifted[::-1])
+    assert area == pytest.approx(0.25)
+
+
+def test_shared_edge_does_not_overlap():
+    neighbor = [(x + 1.0, y) for x, y in UNIT_SQUARE]
+    assert intersect_polygons(UNIT_SQUARE, neighbor) == ([], 0.0)
+
+
+def test_concave_polygon():
+    _, area = intersect_polygons(L_SHAPE, UNIT_SQUARE)
+    assert area == pytest.approx(0.75)
+    _, area = intersect_polygons(UNIT_SQUARE, L_SHAPE)
+    assert area == pytest.approx(0.75)
+
+
+@pytest.mark.parametrize(
+    "collapsed",
+    [
+        [(0.0, 0.0), (1.0, 1.0), (0.5, 0.5)],
+        [(0.5, 0.5), (0.5, 0.5), (0.5, 0.5)],
+        [(0.0, 0.0), (1.0, 1.0)],
+    ],
+)
+def test_collapsed_polygon_does_not_overlap(collapsed):
+    assert intersect_polygons(collapsed, UNIT_SQUARE) == ([], 0.0)
+    assert intersect_polygons(UNIT_SQUARE, collapsed) == ([], 0.0)
+
+
+def test_flat_array_input():
+    flat = np.array(UNIT_SQUARE, dtype=np.float32).reshape(-1)
+    _, area = intersect_polygons(flat, UNIT_SQUARE)
+    assert area == pytest.approx(1.0)
+
+
+def test_polygon_areas():
+    uvs = np.array(UNIT_SQUARE + UNIT_SQUARE[::-1] + L_SHAPE)
+    offsets = [0, 4, 8, 14]
+    assert polygon_areas(offsets, uvs) == pytest.approx([1.0, -1.0, 0.75])
+    assert len(polygon_areas([0], np.empty((0, 2)))) == 0